@@ -9,9 +9,28 @@ from .health import router as health_router
 from .tasks import router as tasks_router
 from .users import router as users_router
 
-api_router = APIRouter()
-api_router.include_router(auth_router)
-api_router.include_router(tasks_router)
-api_router.include_router(users_router)
 
-__all__ = ["api_router", "auth_router", "health_router", "tasks_router", "users_router"]
+def build_api_router(prefix: str = "") -> APIRouter:
+    """Assemble the aggregate API router with the prefix baked in.
+
+    Creating the root router with its final prefix means each route is
+    copied once when the sub-routers are included, instead of a second
+    time when ``include_router(..., prefix=...)`` re-prefixes them.
+    """
+    router = APIRouter(prefix=prefix)
+    router.include_router(auth_router)
+    router.include_router(tasks_router)
+    router.include_router(users_router)
+    return router
+
+
+api_router = build_api_router()
+
+__all__ = [
+    "api_router",
+    "auth_router",
+    "build_api_router",
+    "health_router",
+    "tasks_router",
+    "users_router",
+]
@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException, Query, Response, status
 
 from ...deps import CurrentUserDependency, DatabaseSessionDependency
 from ...models import TaskStatus, User, UserRole
-from ...schemas import TaskCreate, TaskListResponse, TaskRead, TaskUpdate
+from ...schemas import TaskCreate, TaskListResponse, TaskRead, TaskStatistics, TaskUpdate
 from ...services import TaskService
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -103,6 +103,38 @@ async def list_tasks(
     )
 
 
+@router.get(
+    "/statistics",
+    response_model=TaskStatistics,
+    summary="Aggregate task counts by status",
+)
+async def get_task_statistics(
+    session: DatabaseSessionDependency,
+    current_user: CurrentUserDependency,
+    owner_id: OwnerQuery = None,
+) -> TaskStatistics:
+    service = TaskService(session)
+    current_user_id = _require_user_id(current_user)
+    effective_owner_id = owner_id
+
+    if not _is_admin(current_user):
+        if owner_id is not None and owner_id != current_user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not permitted to view statistics for other owners.",
+            )
+        effective_owner_id = current_user_id
+    elif owner_id is None:
+        effective_owner_id = current_user_id
+
+    counts = await service.count_tasks_by_status(effective_owner_id)
+    return TaskStatistics(
+        owner_id=effective_owner_id,
+        total=sum(counts.values()),
+        by_status={task_status.value: count for task_status, count in counts.items()},
+    )
+
+
 @router.get(
     "/{task_id}",
     response_model=TaskRead,
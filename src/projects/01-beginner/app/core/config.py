@@ -60,6 +60,7 @@ class Settings(BaseSettings):
     app_host: str = Field(default="0.0.0.0", alias="APP_HOST")
     app_port: int = Field(default=8002, alias="APP_PORT")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    enable_openapi: bool = Field(default=False, alias="ENABLE_OPENAPI")
     reload: bool = Field(default=True, alias="RELOAD")
     jwt_secret_key: str = Field(default="change-me", alias="JWT_SECRET_KEY")
     jwt_refresh_secret_key: str = Field(
@@ -5,17 +5,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from threading import Lock
 from typing import Any, Sequence
 from uuid import uuid4
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from .config import Settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Pre-bound for the token-minting and blacklist hot paths.
+_UTC = timezone.utc
+_now = datetime.now
+
 
 class TokenType(str, Enum):
     """Enumerates supported JWT token types."""
@@ -63,7 +68,7 @@ def _create_token(
     token_type: TokenType,
     expires_delta: timedelta | None = None,
 ) -> GeneratedToken:
-    now = datetime.now(timezone.utc)
+    now = _now(_UTC)
     if expires_delta is None:
         minutes = (
             settings.access_token_expire_minutes
@@ -125,10 +130,21 @@ def create_refresh_token(
     )
 
 
+@lru_cache(maxsize=8)
+def _verification_key(secret: str, algorithm: str) -> Any:
+    """Return a constructed JWK for ``secret``, built once per (secret, alg).
+
+    ``jwt.decode`` otherwise rebuilds the key object from the raw string on
+    every call, which sits on the hot path of each authenticated request.
+    """
+
+    return jwk.construct(secret, algorithm)
+
+
 def decode_token(*, token: str, secret: str, algorithm: str) -> dict[str, Any]:
     """Decode a JWT token and return its payload."""
 
-    return jwt.decode(token, secret, algorithms=[algorithm])
+    return jwt.decode(token, _verification_key(secret, algorithm), algorithms=[algorithm])
 
 
 class TokenBlacklist:
@@ -140,12 +156,12 @@ class TokenBlacklist:
 
     def add(self, jti: str, expires_at: datetime) -> None:
         with self._lock:
-            self._purge_locked(datetime.now(timezone.utc))
+            self._purge_locked(_now(_UTC))
             self._revoked[jti] = expires_at
 
     def is_revoked(self, jti: str) -> bool:
         with self._lock:
-            self._purge_locked(datetime.now(timezone.utc))
+            self._purge_locked(_now(_UTC))
             return jti in self._revoked
 
     def _purge_locked(self, current: datetime) -> None:
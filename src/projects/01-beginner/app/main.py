@@ -2,40 +2,68 @@
 
 from __future__ import annotations
 
-import uvicorn
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
-from .api.routers import api_router, health_router
 from .core.config import Settings, get_settings
 from .core.logging import configure_logging
 from .core.middleware import CorrelationIdMiddleware
 from .deps import SettingsDependency
-from .errors import register_exception_handlers
 from .schemas.system import RootResponse
 
 
+@cache
+def _compute_prefix(raw: str) -> tuple[str, str]:
+    """Normalise an API prefix and derive its OpenAPI path.
+
+    Cached so repeated app construction (test fixtures build many apps)
+    reuses the same strings instead of re-running the normalisation.
+    """
+    prefix = raw.strip().strip("/")
+    router_prefix = f"/{prefix}" if prefix else ""
+    return router_prefix, f"{router_prefix}/openapi.json"
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan: release pooled database connections on shutdown."""
+    yield
+    from .db.session import engine
+
+    await engine.dispose()
+
+
 def create_app() -> FastAPI:
     """Instantiate and configure the FastAPI application."""
+    # Imported where they are used: pulling in the router tree (and every
+    # endpoint module behind it) is deferred until an app is actually built,
+    # so callers of the pure helpers in this module skip that cost.
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from .api.routers import build_api_router, health_router
+    from .errors import register_exception_handlers
+
     settings = get_settings()
     configure_logging(settings)
 
-    raw_prefix = settings.api_prefix.strip()
-    router_prefix = raw_prefix
-    if router_prefix and not router_prefix.startswith("/"):
-        router_prefix = f"/{router_prefix}"
-    router_prefix = router_prefix.rstrip("/")
-    if router_prefix == "/":
-        router_prefix = ""
-    openapi_url = "/openapi.json" if not router_prefix else f"{router_prefix}/openapi.json"
+    router_prefix, openapi_path = _compute_prefix(settings.api_prefix)
+
+    # Building the OpenAPI schema walks every route's Pydantic models; skip
+    # that startup cost entirely for processes that never serve the docs UI.
+    serve_docs = settings.enable_openapi or settings.environment in ("development", "local")
+    openapi_url = openapi_path if serve_docs else None
 
     application = FastAPI(
         title=settings.project_name,
         version=settings.version,
         summary="Starter FastAPI service scaffold.",
-        docs_url="/docs",
-        redoc_url="/redoc",
+        docs_url="/docs" if serve_docs else None,
+        redoc_url="/redoc" if serve_docs else None,
         openapi_url=openapi_url,
+        lifespan=lifespan,
     )
 
     application.state.settings = settings
@@ -50,11 +78,7 @@ def create_app() -> FastAPI:
         allow_headers=settings.cors_allow_headers,
     )
 
-    if router_prefix:
-        application.include_router(api_router, prefix=router_prefix)
-    else:
-        application.include_router(api_router)
-
+    application.include_router(build_api_router(router_prefix))
     application.include_router(health_router)
 
     register_exception_handlers(application)
@@ -78,6 +102,9 @@ async def read_root(settings: SettingsDependency) -> RootResponse:
 
 def run() -> None:
     """Convenience entry point for ``poetry run beginner-app``."""
+    # uvicorn drags in h11/click and friends; only the server process pays.
+    import uvicorn
+
     settings: Settings = get_settings()
     uvicorn.run(
         "projects.01-beginner.app.main:app",
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
-from .common import TimestampMixin
-from .task import Task, TaskBase, TaskStatus
-from .user import User, UserBase, UserRole
+import importlib
+from typing import Any
+
+# Submodules are imported on first attribute access instead of eagerly, so
+# consumers that need a single model do not pull in every table definition.
+_LAZY = {
+    "TimestampMixin": ".common",
+    "Task": ".task",
+    "TaskBase": ".task",
+    "TaskStatus": ".task",
+    "USER_ROLE_VALUES": ".user",
+    "User": ".user",
+    "UserBase": ".user",
+    "UserRole": ".user",
+}
 
 __all__ = [
+    "USER_ROLE_VALUES",
     "Task",
     "TaskBase",
     "TaskStatus",
@@ -15,3 +28,17 @@ __all__ = [
     "UserBase",
     "UserRole",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -8,9 +8,15 @@ import sqlalchemy as sa
 from sqlmodel import Field, SQLModel
 
 
+# Bound once: this runs as default_factory for every timestamp column on
+# every new row, so the per-call module attribute lookups are worth shaving.
+_UTC = timezone.utc
+_now = datetime.now
+
+
 def utcnow() -> datetime:
     """Return a timezone-aware UTC timestamp."""
-    return datetime.now(timezone.utc)
+    return _now(_UTC)
 
 
 class TimestampMixin(SQLModel, table=False):
@@ -26,21 +26,24 @@ class TaskStatus(str, Enum):
 class TaskBase(SQLModel, table=False):
     """Shared attributes for task models."""
 
+    # sa_type/sa_column_kwargs lets SQLModel derive the column in one pass;
+    # handing over a pre-built sa.Column makes it re-copy and re-derive the
+    # metadata per field at class-creation time.
     title: str = Field(
         max_length=255,
-        sa_column=sa.Column(sa.String(length=255), nullable=False),
+        nullable=False,
+        sa_type=sa.String(length=255),
     )
     description: str | None = Field(
         default=None,
-        sa_column=sa.Column(sa.Text(), nullable=True),
+        nullable=True,
+        sa_type=sa.Text(),
     )
     status: TaskStatus = Field(
         default=TaskStatus.PENDING,
-        sa_column=sa.Column(
-            sa.Enum(TaskStatus, name="task_status", native_enum=False, validate_strings=True),
-            nullable=False,
-            server_default=TaskStatus.PENDING.value,
-        ),
+        nullable=False,
+        sa_type=sa.Enum(TaskStatus, name="task_status", native_enum=False, validate_strings=True),
+        sa_column_kwargs={"server_default": TaskStatus.PENDING.value},
     )
     owner_id: int = Field(
         sa_column=sa.Column(
@@ -64,4 +67,10 @@ class Task(TaskBase, TimestampMixin, table=True):
     owner: "User" = Relationship(back_populates="tasks")
 
 
+# Imported after the class definitions to close the Task <-> User cycle,
+# then rebuild once so the "User" forward reference resolves at import time.
+from .user import User  # noqa: E402
+
+Task.model_rebuild(force=True)
+
 __all__ = ["Task", "TaskBase", "TaskStatus"]
@@ -21,37 +21,39 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
+# Precomputed value table for hot paths (token minting reads the role value
+# per login); a dict hit is cheaper than the Enum.value descriptor lookup.
+USER_ROLE_VALUES: dict[UserRole, str] = {role: role.value for role in UserRole}
+
+
 class UserBase(SQLModel, table=False):
     """Shared attributes for user models."""
 
+    # sa_type/sa_column_kwargs lets SQLModel derive each column in a single
+    # pass instead of deep-copying a pre-built sa.Column at class creation.
     email: str = Field(
         max_length=320,
-        sa_column=sa.Column(
-            sa.String(length=320),
-            nullable=False,
-            unique=True,
-        ),
+        nullable=False,
+        sa_type=sa.String(length=320),
+        sa_column_kwargs={"unique": True},
     )
     full_name: str | None = Field(
         default=None,
         max_length=255,
-        sa_column=sa.Column(sa.String(length=255), nullable=True),
+        nullable=True,
+        sa_type=sa.String(length=255),
     )
     is_active: bool = Field(
         default=True,
-        sa_column=sa.Column(
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.true(),
-        ),
+        nullable=False,
+        sa_type=sa.Boolean(),
+        sa_column_kwargs={"server_default": sa.true()},
     )
     role: UserRole = Field(
         default=UserRole.USER,
-        sa_column=sa.Column(
-            sa.Enum(UserRole, name="user_role", native_enum=False),
-            nullable=False,
-            server_default=UserRole.USER.value,
-        ),
+        nullable=False,
+        sa_type=sa.Enum(UserRole, name="user_role", native_enum=False),
+        sa_column_kwargs={"server_default": UserRole.USER.value},
     )
 
 
@@ -64,7 +66,8 @@ class User(UserBase, TimestampMixin, table=True):
     id: int | None = Field(default=None, primary_key=True)
     hashed_password: str = Field(
         max_length=255,
-        sa_column=sa.Column(sa.String(length=255), nullable=False),
+        nullable=False,
+        sa_type=sa.String(length=255),
     )
     tasks: list["Task"] = Relationship(
         back_populates="owner",
@@ -72,4 +75,11 @@ class User(UserBase, TimestampMixin, table=True):
     )
 
 
-__all__ = ["User", "UserBase", "UserRole"]
+# Imported after the class definitions to close the User <-> Task cycle,
+# then rebuild once so the "Task" forward reference is resolved at import
+# time instead of lazily on the first request that validates a User.
+from .task import Task  # noqa: E402
+
+User.model_rebuild(force=True)
+
+__all__ = ["USER_ROLE_VALUES", "User", "UserBase", "UserRole"]
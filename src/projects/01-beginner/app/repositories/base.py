@@ -28,8 +28,8 @@ class BaseRepository(Generic[ModelType]):
 
     async def list(self) -> list[ModelType]:
         """Return all entities of the repository type."""
-        result = await self._session.execute(select(self._model_type))
-        return list(result.scalars().all())
+        result = await self._session.scalars(select(self._model_type))
+        return result.all()
 
     async def add(self, instance: ModelType) -> ModelType:
         """Add and flush a new entity instance."""
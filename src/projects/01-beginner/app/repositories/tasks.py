@@ -34,25 +34,38 @@ class TaskRepository(BaseRepository[Task]):
             query = query.where(Task.status == status)
             count_query = count_query.where(Task.status == status)
         query = query.order_by(Task.id).limit(limit).offset(offset)
-        result = await self.session.execute(query)
-        tasks = list(result.scalars().all())
-        total_result = await self.session.execute(count_query)
-        total = int(total_result.scalar_one())
+        tasks = (await self.session.scalars(query)).all()
+        total = int(await self.session.scalar(count_query))
         return tasks, total
 
     async def list_for_owner(self, owner_id: int) -> list[Task]:
         """Return all tasks assigned to the given owner."""
-        result = await self.session.execute(select(Task).where(Task.owner_id == owner_id))
-        return list(result.scalars().all())
+        result = await self.session.scalars(select(Task).where(Task.owner_id == owner_id))
+        return result.all()
 
     async def get_for_owner(self, task_id: int, owner_id: int) -> Task | None:
         """Retrieve a task by ID ensuring it belongs to the provided owner."""
-        result = await self.session.execute(
+        return await self.session.scalar(
             select(Task).where(Task.id == task_id, Task.owner_id == owner_id)
         )
-        return result.scalar_one_or_none()
 
     async def list_by_status(self, status: TaskStatus) -> list[Task]:
         """Return tasks filtered by status."""
-        result = await self.session.execute(select(Task).where(Task.status == status))
-        return list(result.scalars().all())
+        result = await self.session.scalars(select(Task).where(Task.status == status))
+        return result.all()
+
+    async def count_by_status(self, owner_id: int) -> dict[TaskStatus, int]:
+        """Return task counts per status for an owner via one GROUP BY query.
+
+        A single aggregate statement replaces loading every task row and
+        counting in Python; statuses with no tasks map to zero.
+        """
+        result = await self.session.execute(
+            select(Task.status, func.count())
+            .where(Task.owner_id == owner_id)
+            .group_by(Task.status)
+        )
+        counts = dict.fromkeys(TaskStatus, 0)
+        for status, count in result:
+            counts[status] = int(count)
+        return counts
@@ -4,12 +4,26 @@ from __future__ import annotations
 
 from typing import Sequence
 
+from sqlalchemy import bindparam
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models import User
 from .base import BaseRepository
 
+# Upper bound on bound parameters per IN clause; keeps statements well under
+# driver limits even for very large ID lists.
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+# Statements built once at import: the per-call select() construction and
+# clause walk are skipped on these auth-hot lookups, and SQLAlchemy's
+# compiled-statement cache keys stay stable.
+_GET_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_GET_USER_BY_EMAIL_WITH_TASKS = _GET_USER_BY_EMAIL.options(selectinload(User.tasks))
+_LIST_ACTIVE = select(User).where(User.is_active.is_(True))
+_LIST_ACTIVE_WITH_TASKS = _LIST_ACTIVE.options(selectinload(User.tasks))
+
 
 class UserRepository(BaseRepository[User]):
     """Concrete repository for CRUD operations on ``User`` entities."""
@@ -17,19 +31,52 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, User)
 
-    async def get_by_email(self, email: str) -> User | None:
-        """Return a user matching the supplied email if it exists."""
-        result = await self.session.execute(select(User).where(User.email == email))
-        return result.scalar_one_or_none()
+    async def get_by_email(self, email: str, *, load_tasks: bool = False) -> User | None:
+        """Return a user matching the supplied email if it exists.
+
+        Pass ``load_tasks=True`` when the caller will touch ``user.tasks``;
+        the collection is then fetched eagerly instead of via a lazy-load
+        SELECT on first access.
+        """
+        statement = _GET_USER_BY_EMAIL_WITH_TASKS if load_tasks else _GET_USER_BY_EMAIL
+        # session.scalar skips the intermediate Result proxy entirely.
+        return await self.session.scalar(statement, {"email": email})
+
+    async def list_active(self, *, load_tasks: bool = False) -> list[User]:
+        """Return all active users, optionally with their task collections.
+
+        Eager loading turns the classic N+1 (one SELECT per user whose
+        ``tasks`` is accessed) into a single additional IN query.
+        """
+        statement = _LIST_ACTIVE_WITH_TASKS if load_tasks else _LIST_ACTIVE
+        return (await self.session.scalars(statement)).all()
 
-    async def list_active(self) -> list[User]:
-        """Return all active users."""
-        result = await self.session.execute(select(User).where(User.is_active.is_(True)))
-        return list(result.scalars().all())
+    async def list_by_ids(
+        self,
+        ids: Sequence[int],
+        *,
+        load_tasks: bool = False,
+    ) -> list[User]:
+        """Fetch all users whose IDs are contained in the provided sequence.
 
-    async def list_by_ids(self, ids: Sequence[int]) -> list[User]:
-        """Fetch all users whose IDs are contained in the provided sequence."""
+        IDs are queried in fixed-size chunks so the IN clause stays within
+        driver parameter limits regardless of input size. Results preserve
+        the input order and drop duplicates.
+        """
         if not ids:
             return []
-        result = await self.session.execute(select(User).where(User.id.in_(ids)))
-        return list(result.scalars().all())
+        found: dict[int, User] = {}
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
+            statement = select(User).where(User.id.in_(chunk))
+            if load_tasks:
+                statement = statement.options(selectinload(User.tasks))
+            for user in await self.session.scalars(statement):
+                found[user.id] = user
+        seen: set[int] = set()
+        ordered: list[User] = []
+        for user_id in ids:
+            if user_id in found and user_id not in seen:
+                seen.add(user_id)
+                ordered.append(found[user_id])
+        return ordered
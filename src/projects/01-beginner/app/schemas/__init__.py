@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-from .auth import (
-    AuthResponse,
-    AuthTokens,
-    RefreshRequest,
-    RefreshResponse,
-    SignupRequest,
-    TokenPayload,
-)
-from .system import ErrorResponse, HealthCheckResponse, RootResponse
-from .task import TaskCreate, TaskListResponse, TaskRead, TaskUpdate
-from .user import UserPublic
+import importlib
+from typing import Any
+
+# Lazily resolved on first access so importing one schema does not drag in
+# the auth stack (email validation, token models) or every other module.
+_LAZY = {
+    "AuthResponse": ".auth",
+    "AuthTokens": ".auth",
+    "RefreshRequest": ".auth",
+    "RefreshResponse": ".auth",
+    "SignupRequest": ".auth",
+    "TokenPayload": ".auth",
+    "ErrorResponse": ".system",
+    "HealthCheckResponse": ".system",
+    "RootResponse": ".system",
+    "TaskCreate": ".task",
+    "TaskListResponse": ".task",
+    "TaskRead": ".task",
+    "TaskStatistics": ".task",
+    "TaskUpdate": ".task",
+    "UserPublic": ".user",
+}
 
 __all__ = [
     "AuthResponse",
@@ -26,7 +37,22 @@ __all__ = [
     "TaskCreate",
     "TaskListResponse",
     "TaskRead",
+    "TaskStatistics",
     "TaskUpdate",
     "TokenPayload",
     "UserPublic",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..core.security import TokenType
 from .user import UserPublic
@@ -13,10 +13,22 @@ from .user import UserPublic
 class SignupRequest(BaseModel):
     """Incoming payload for registering a new user."""
 
-    email: EmailStr
+    email: str
     password: str = Field(min_length=8)
     full_name: str | None = None
 
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: str) -> str:
+        # Imported lazily: EmailStr loads email_validator (and idna/dns
+        # machinery) at class-definition time, which taxes every cold start.
+        from email_validator import EmailNotValidError, validate_email
+
+        try:
+            return validate_email(value, check_deliverability=False).normalized
+        except EmailNotValidError as exc:
+            raise ValueError(str(exc)) from exc
+
 
 class RefreshRequest(BaseModel):
     """Request payload for refreshing JWT tokens."""
@@ -55,9 +55,12 @@ class TaskUpdate(BaseModel):
 
     @model_validator(mode="after")
     def _ensure_payload_not_empty(self) -> "TaskUpdate":
-        if not self.model_dump(exclude_unset=True, exclude_none=True):
-            raise ValueError("At least one field must be provided for update.")
-        return self
+        # Scan the set fields directly instead of materialising a model_dump
+        # dict just to test emptiness; this runs on every PATCH request.
+        for name in self.model_fields_set:
+            if getattr(self, name) is not None:
+                return self
+        raise ValueError("At least one field must be provided for update.")
 
 
 class TaskRead(BaseModel):
@@ -97,6 +100,28 @@ class TaskListResponse(BaseModel):
     offset: int
 
 
+TASK_STATISTICS_EXAMPLE = {
+    "owner_id": 42,
+    "total": 3,
+    "by_status": {
+        TaskStatus.PENDING.value: 2,
+        TaskStatus.IN_PROGRESS.value: 1,
+        TaskStatus.COMPLETED.value: 0,
+        TaskStatus.CANCELLED.value: 0,
+    },
+}
+
+
+class TaskStatistics(BaseModel):
+    """Per-status task counts for a single owner."""
+
+    model_config = ConfigDict(json_schema_extra={"example": TASK_STATISTICS_EXAMPLE})
+
+    owner_id: int
+    total: int = Field(ge=0)
+    by_status: dict[str, int] = Field(default_factory=dict)
+
+
 __all__ = [
     "TaskCreate",
     "TaskListResponse",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict
 
 from ..models import UserRole
 
@@ -13,7 +13,9 @@ class UserPublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
-    email: EmailStr
+    # Plain str: addresses are validated on the way in (SignupRequest), so
+    # re-validating them on every serialised response buys nothing.
+    email: str
     full_name: str | None = None
     role: UserRole
 
@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
-from .auth import AuthService
-from .tasks import TaskService
-from .users import UserService
+import importlib
+from typing import Any
+
+# Each service module is imported only when its class is first referenced.
+_LAZY = {
+    "AuthService": ".auth",
+    "TaskService": ".tasks",
+    "UserService": ".users",
+}
 
 __all__ = ["AuthService", "TaskService", "UserService"]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
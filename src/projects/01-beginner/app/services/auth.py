@@ -21,7 +21,7 @@ from ..core.security import (
     verify_password,
 )
 from ..errors import ApplicationError
-from ..models import User, UserRole
+from ..models import USER_ROLE_VALUES, User, UserRole
 from ..repositories import UserRepository
 from ..schemas.auth import TokenPayload
 from .users import UserService
@@ -81,7 +81,7 @@ class AuthService:
     def build_token_pair(self, user: User) -> TokenPair:
         if user.id is None:
             raise ApplicationError("User must be persisted before issuing tokens.")
-        roles = [user.role.value]
+        roles = [USER_ROLE_VALUES[user.role]]
         access = create_access_token(
             subject=user.id,
             roles=roles,
@@ -80,6 +80,10 @@ class TaskService:
         """Return tasks filtered by their status."""
         return await self._repository.list_by_status(status)
 
+    async def count_tasks_by_status(self, owner_id: int) -> dict[TaskStatus, int]:
+        """Return per-status task counts for an owner from a single query."""
+        return await self._repository.count_by_status(owner_id)
+
     async def list_tasks_paginated(
         self,
         *,
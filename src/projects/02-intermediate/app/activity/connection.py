@@ -10,6 +10,7 @@ from pymongo.errors import OperationFailure
 
 from ..core.config import get_settings
 from .models import ActivityEvent
+from .service import _invalidate_feed_cache
 
 _client: AsyncIOMotorClient | None = None
 _database: AsyncIOMotorDatabase | None = None
@@ -97,6 +98,7 @@ async def close_activity_store() -> None:
     _client = None
     _database = None
     _initialized = False
+    _invalidate_feed_cache()
 
 
 def get_activity_collection() -> AsyncIOMotorCollection:
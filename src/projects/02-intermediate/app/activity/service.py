@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from enum import Enum
@@ -43,6 +45,17 @@ def _normalise_metadata(metadata: Mapping[str, Any] | None) -> dict[str, Any]:
     return {str(key): _serialise_value(value) for key, value in metadata.items()}
 
 
+# The HTMX feed polls every few seconds per open tab, so recent-event pages
+# are memoised in-process for a short window; any write clears the cache.
+_FEED_CACHE_TTL_SECONDS = 2.0
+_feed_cache: dict[int, tuple[float, list[ActivityEvent]]] = {}
+_feed_cache_lock = asyncio.Lock()
+
+
+def _invalidate_feed_cache() -> None:
+    _feed_cache.clear()
+
+
 def _display_name(user: "User" | None) -> str | None:
     if user is None:
         return None
@@ -80,6 +93,7 @@ class ActivityLogService:
             source=source,
         )
         await event.insert()
+        _invalidate_feed_cache()
         return event
 
     async def record_login(self, actor: "User", *, source: str) -> ActivityEvent:
@@ -148,9 +162,19 @@ class ActivityLogService:
 
     async def list_recent(self, *, limit: int | None = None) -> list[ActivityEvent]:
         page_size = self._default_page_size if limit is None else max(int(limit), 1)
-        return (
-            await ActivityEvent.find_all()
-            .sort("-created_at")
-            .limit(page_size)
-            .to_list()
-        )
+        now = time.monotonic()
+        cached = _feed_cache.get(page_size)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        async with _feed_cache_lock:
+            cached = _feed_cache.get(page_size)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            events = (
+                await ActivityEvent.find_all()
+                .sort("-created_at")
+                .limit(page_size)
+                .to_list()
+            )
+            _feed_cache[page_size] = (time.monotonic() + _FEED_CACHE_TTL_SECONDS, events)
+        return events
@@ -2,22 +2,52 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any
+import asyncio
+import logging
+from typing import Annotated, Any, Coroutine
 
 from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
 from ...core.cache import (
     TASK_LIST_CACHE_NAMESPACE,
     TASK_STATISTICS_CACHE_NAMESPACE,
     cache_get_or_set,
 )
-from ...deps import ActivityServiceDependency, CurrentUserDependency, DatabaseSessionDependency
+from ...deps import ActivityServiceDependency, CurrentUserDependency, TaskServiceDependency
 from ...models import TaskStatus, User, UserRole
 from ...schemas import TaskCreate, TaskListResponse, TaskRead, TaskStatistics, TaskUpdate
-from ...services import TaskService
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+logger = logging.getLogger("projects.02-intermediate.app.api.routers.tasks")
+
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskRead])
+
+# Strong references to in-flight activity recordings; asyncio only keeps weak
+# references to scheduled tasks, so these would otherwise be garbage collected.
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _on_activity_done(task: asyncio.Task[Any]) -> None:
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exception = task.exception()
+    if exception is not None:
+        # Fire-and-forget: surface the failure here, deterministically,
+        # instead of as an "exception was never retrieved" warning at GC.
+        logger.error("Failed to record activity event.", exc_info=exception)
+
+
+def _dispatch_activity(coroutine: Coroutine[Any, Any, Any]) -> None:
+    """Record activity in the background without delaying the response."""
+
+    task = asyncio.create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_activity_done)
+
+
 LimitQuery = Annotated[
     int,
     Query(
@@ -50,6 +80,25 @@ OwnerQuery = Annotated[
         description="Restrict results to tasks owned by the provided user id.",
     ),
 ]
+CursorQuery = Annotated[
+    int | None,
+    Query(
+        default=None,
+        ge=1,
+        description=(
+            "Return tasks with id strictly less than this (keyset pagination"
+            " cursor). Pass the next_cursor of the previous page to fetch the"
+            " following, older page."
+        ),
+    ),
+]
+IncludeTotalQuery = Annotated[
+    bool,
+    Query(
+        default=False,
+        description="Include the total number of matching tasks (issues a COUNT query).",
+    ),
+]
 
 
 def _require_user_id(user: User) -> int:
@@ -69,34 +118,26 @@ def _map_task(task) -> TaskRead:
     return TaskRead.model_validate(task)
 
 
-def _serialise_updates(updates: dict[str, Any]) -> dict[str, Any]:
-    cleaned: dict[str, Any] = {}
-    for key, value in updates.items():
-        if isinstance(value, TaskStatus):
-            cleaned[key] = value.value
-        else:
-            cleaned[key] = value
-    return cleaned
-
-
 @router.get(
     "/",
     response_model=TaskListResponse,
     summary="List tasks with pagination and optional filtering",
 )
 async def list_tasks(
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     current_user: CurrentUserDependency,
     limit: LimitQuery = 20,
     offset: OffsetQuery = 0,
     status: StatusQuery = None,
     owner_id: OwnerQuery = None,
+    after_id: CursorQuery = None,
+    include_total: IncludeTotalQuery = False,
 ) -> TaskListResponse:
-    service = TaskService(session)
     current_user_id = _require_user_id(current_user)
+    is_admin = _is_admin(current_user)
     effective_owner_id = owner_id
 
-    if not _is_admin(current_user):
+    if not is_admin:
         if owner_id is not None and owner_id != current_user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -110,17 +151,25 @@ async def list_tasks(
             status=status,
             limit=limit,
             offset=offset,
+            after_id=after_id,
+            include_total=include_total,
         )
+        items = _TASK_LIST_ADAPTER.validate_python(tasks)
         return TaskListResponse(
-            items=[_map_task(task) for task in tasks],
+            items=items,
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=items[-1].id if items else None,
         )
 
     owner_fragment = effective_owner_id if effective_owner_id is not None else "all"
     status_fragment = status.value if status is not None else "all"
-    cache_key = f"owner={owner_fragment}:status={status_fragment}:limit={limit}:offset={offset}"
+    cursor_fragment = after_id if after_id is not None else "none"
+    cache_key = (
+        f"owner={owner_fragment}:status={status_fragment}"
+        f":limit={limit}:offset={offset}:after={cursor_fragment}:total={include_total}"
+    )
     return await cache_get_or_set(
         namespace=TASK_LIST_CACHE_NAMESPACE,
         key=cache_key,
@@ -135,15 +184,15 @@ async def list_tasks(
     summary="Aggregate task statistics",
 )
 async def get_task_statistics(
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     current_user: CurrentUserDependency,
     owner_id: OwnerQuery = None,
 ) -> TaskStatistics:
-    service = TaskService(session)
     current_user_id = _require_user_id(current_user)
+    is_admin = _is_admin(current_user)
     effective_owner_id = owner_id
 
-    if not _is_admin(current_user):
+    if not is_admin:
         if owner_id is not None and owner_id != current_user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -176,10 +225,9 @@ async def get_task_statistics(
 )
 async def get_task(
     task_id: int,
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     current_user: CurrentUserDependency,
 ) -> TaskRead:
-    service = TaskService(session)
     task = await service.get_task(task_id)
     if task is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
@@ -202,11 +250,10 @@ async def get_task(
 )
 async def create_task(
     payload: TaskCreate,
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     current_user: CurrentUserDependency,
     activity_service: ActivityServiceDependency,
 ) -> TaskRead:
-    service = TaskService(session)
     current_user_id = _require_user_id(current_user)
 
     try:
@@ -219,7 +266,9 @@ async def create_task(
     except ValueError as exc:  # pragma: no cover - defensive guard
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
-    await activity_service.record_task_created(actor=current_user, task=task, source="api")
+    _dispatch_activity(
+        activity_service.record_task_created(actor=current_user, task=task, source="api")
+    )
     return _map_task(task)
 
 
@@ -231,19 +280,19 @@ async def create_task(
 async def update_task(
     task_id: int,
     payload: TaskUpdate,
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     current_user: CurrentUserDependency,
     activity_service: ActivityServiceDependency,
 ) -> TaskRead:
-    service = TaskService(session)
+    current_user_id = _require_user_id(current_user)
+    is_admin = _is_admin(current_user)
     updates = payload.model_dump(exclude_unset=True)
-    changes = _serialise_updates(updates)
+    changes = payload.model_dump(exclude_unset=True, mode="json")
 
     try:
-        if _is_admin(current_user):
+        if is_admin:
             task = await service.update_task(task_id, **updates)
         else:
-            current_user_id = _require_user_id(current_user)
             task = await service.update_task_for_owner(task_id, current_user_id, **updates)
     except PermissionError:
         raise HTTPException(
@@ -253,11 +302,13 @@ async def update_task(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
 
-    await activity_service.record_task_updated(
-        actor=current_user,
-        task=task,
-        source="api",
-        changes=changes,
+    _dispatch_activity(
+        activity_service.record_task_updated(
+            actor=current_user,
+            task=task,
+            source="api",
+            changes=changes,
+        )
     )
     return _map_task(task)
 
@@ -269,16 +320,16 @@ async def update_task(
 )
 async def delete_task(
     task_id: int,
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     current_user: CurrentUserDependency,
 ) -> Response:
-    service = TaskService(session)
+    current_user_id = _require_user_id(current_user)
+    is_admin = _is_admin(current_user)
 
     try:
-        if _is_admin(current_user):
+        if is_admin:
             deleted = await service.delete_task(task_id)
         else:
-            current_user_id = _require_user_id(current_user)
             deleted = await service.delete_task_for_owner(task_id, current_user_id)
     except PermissionError:
         raise HTTPException(
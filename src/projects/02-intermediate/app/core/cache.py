@@ -7,17 +7,20 @@ from threading import Lock
 from typing import Any, Awaitable, Callable, TypeVar, cast
 
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from redis.asyncio import Redis
 
-from .config import get_settings
+from .config import Settings, get_settings
 
 T = TypeVar("T")
 
 logger = logging.getLogger("projects.02-intermediate.app.core.cache")
 
-TASK_LIST_CACHE_NAMESPACE = "tasks:list"
+# v2: list pages became newest-first, which changed next_cursor semantics;
+# the namespace bump keeps pre-change cached pages from being served.
+TASK_LIST_CACHE_NAMESPACE = "tasks:list:v2"
 TASK_STATISTICS_CACHE_NAMESPACE = "tasks:statistics"
+TASK_REPORT_CACHE_NAMESPACE = "reports:owner"
 
 
 class CacheMetrics:
@@ -71,6 +74,17 @@ class CacheMetrics:
 
 cache_metrics = CacheMetrics()
 
+_adapters: dict[type[BaseModel], TypeAdapter[Any]] = {}
+
+
+def _adapter(model: type[BaseModel]) -> TypeAdapter[Any]:
+    """Return a cached ``TypeAdapter`` for the given model."""
+
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters.setdefault(model, TypeAdapter(model))
+    return adapter
+
 _redis_client: Redis | None = None
 _redis_lock = asyncio.Lock()
 _connection_error_logged = False
@@ -111,10 +125,11 @@ async def _create_redis_client() -> Redis | None:
         return client
 
 
-async def get_cache_client() -> Redis | None:
+async def get_cache_client(settings: Settings | None = None) -> Redis | None:
     """Return a connected Redis client or ``None`` if caching is disabled."""
 
-    settings = get_settings()
+    if settings is None:
+        settings = get_settings()
     if not settings.cache_enabled:
         return None
 
@@ -143,7 +158,7 @@ async def cache_get_or_set(
         cache_metrics.record_skipped()
         return await builder()
 
-    client = await get_cache_client()
+    client = await get_cache_client(settings)
     if client is None:
         cache_metrics.record_skipped()
         return await builder()
@@ -162,18 +177,18 @@ async def cache_get_or_set(
     if cached_payload is not None:
         cache_metrics.record_hit()
         logger.info("Cache hit for %s", cache_key)
-        data = json.loads(cached_payload)
         if model is not None:
-            return cast(T, model.model_validate(data))
-        return cast(T, data)
+            return cast(T, _adapter(model).validate_json(cached_payload))
+        return cast(T, json.loads(cached_payload))
 
     cache_metrics.record_miss()
     logger.info("Cache miss for %s", cache_key)
 
     result = await builder()
-    payload = jsonable_encoder(result)
-
-    serialized = json.dumps(payload)
+    if isinstance(result, BaseModel):
+        serialized = result.model_dump_json()
+    else:
+        serialized = json.dumps(jsonable_encoder(result))
     expiry_source = ttl if ttl is not None else settings.cache_default_ttl_seconds
     expires: int | None
     try:
@@ -201,7 +216,7 @@ async def invalidate_namespace(namespace: str, match: str = "*") -> None:
     if not settings.cache_enabled:
         return
 
-    client = await get_cache_client()
+    client = await get_cache_client(settings)
     if client is None:
         return
 
@@ -224,21 +239,42 @@ async def invalidate_namespace(namespace: str, match: str = "*") -> None:
         logger.info("Invalidated %d cache entries for pattern %s", len(keys), pattern)
 
 
-async def invalidate_task_cache() -> None:
-    """Clear cached task listings and statistics."""
+async def invalidate_task_cache(owner_id: int | None = None) -> None:
+    """Clear cached task listings and statistics.
+
+    With an ``owner_id`` only that owner's entries plus the cross-owner
+    (``owner=all``) admin views are dropped, so one user's mutation no
+    longer evicts every other user's cached lists. ``None`` keeps the
+    old full-namespace flush.
+    """
+
+    if owner_id is None:
+        await invalidate_namespace(TASK_LIST_CACHE_NAMESPACE)
+        await invalidate_namespace(TASK_STATISTICS_CACHE_NAMESPACE)
+        return
+
+    await invalidate_namespace(TASK_LIST_CACHE_NAMESPACE, match=f"owner={owner_id}:*")
+    await invalidate_namespace(TASK_STATISTICS_CACHE_NAMESPACE, match=f"owner={owner_id}")
+    await invalidate_namespace(TASK_LIST_CACHE_NAMESPACE, match="owner=all:*")
+    await invalidate_namespace(TASK_STATISTICS_CACHE_NAMESPACE, match="owner=all")
+
+
+async def invalidate_report_cache(owner_id: int) -> None:
+    """Drop the cached task report for a single owner."""
 
-    await invalidate_namespace(TASK_LIST_CACHE_NAMESPACE)
-    await invalidate_namespace(TASK_STATISTICS_CACHE_NAMESPACE)
+    await invalidate_namespace(TASK_REPORT_CACHE_NAMESPACE, match=str(owner_id))
 
 
 __all__ = [
     "TASK_LIST_CACHE_NAMESPACE",
+    "TASK_REPORT_CACHE_NAMESPACE",
     "TASK_STATISTICS_CACHE_NAMESPACE",
     "cache_get_or_set",
     "cache_metrics",
     "close_cache_client",
     "get_cache_client",
     "invalidate_namespace",
+    "invalidate_report_cache",
     "invalidate_task_cache",
     "set_cache_client",
 ]
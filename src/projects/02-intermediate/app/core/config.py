@@ -13,22 +13,15 @@ except ImportError:  # pragma: no cover - fallback during early bootstrapping
     package_version = "0.1.0"
 
 
-def _resolve_project_dirs() -> tuple[Path, Path]:
-    """Locate the project root and repository root directories."""
+# The layout below this file is fixed (core/ -> app/ -> 02-intermediate/ ->
+# projects/ -> src/ -> repository root), so both directories are plain parent
+# offsets from one resolve() call instead of a per-import path walk.
+_HERE = Path(__file__).resolve()
+PROJECT_DIR = _HERE.parents[2]
+REPOSITORY_ROOT = _HERE.parents[5]
 
-    current = Path(__file__).resolve()
-    project_dir: Path | None = None
-    for parent in current.parents:
-        if parent.name == "02-intermediate":
-            project_dir = parent
-            break
-    if project_dir is None:
-        raise RuntimeError("Unable to determine project directory for intermediate app.")
-    repository_root = project_dir.parent.parent.parent
-    return project_dir, repository_root
-
-
-PROJECT_DIR, REPOSITORY_ROOT = _resolve_project_dirs()
+if PROJECT_DIR.name != "02-intermediate":  # pragma: no cover - layout sanity check
+    raise RuntimeError("Unable to determine project directory for intermediate app.")
 
 EnvironmentName = Literal["development", "test", "ci"]
 
@@ -40,6 +33,8 @@ _ENVIRONMENT_ALIASES: dict[str, EnvironmentName] = {
     "ci": "ci",
 }
 
+_VALID_SAME_SITE: frozenset[str] = frozenset({"lax", "strict", "none"})
+
 _ENVIRONMENT_PROFILES: dict[EnvironmentName, dict[str, Any]] = {
     "development": {
         "log_level": "DEBUG",
@@ -110,9 +105,15 @@ class Settings(BaseSettings):
         alias="REFRESH_TOKEN_EXPIRE_MINUTES",
     )
     db_echo: bool = Field(default=False, alias="DB_ECHO")
+    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=40, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_seconds: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
     cache_enabled: bool = Field(default=True, alias="CACHE_ENABLED")
     cache_default_ttl_seconds: int = Field(default=60, alias="CACHE_TTL_SECONDS")
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: int = Field(default=10, alias="REDIS_POOL_TIMEOUT_SECONDS")
+    redis_health_check_interval: int = Field(default=30, alias="REDIS_HEALTH_CHECK_INTERVAL_SECONDS")
     job_queue_name: str = Field(default="intermediate:tasks", alias="JOB_QUEUE_NAME")
     job_worker_name: str = Field(default="intermediate-worker", alias="JOB_WORKER_NAME")
     job_default_timeout: int = Field(default=300, alias="JOB_TIMEOUT_SECONDS")
@@ -123,6 +124,8 @@ class Settings(BaseSettings):
         alias="JOB_RETRY_BACKOFF_SECONDS",
     )
 
+    max_form_bytes: int = Field(default=64 * 1024, alias="MAX_FORM_BYTES")
+
     session_secret_key: str = Field(default="change-me-session", alias="SESSION_SECRET_KEY")
     session_cookie_name: str = Field(default="intermediate_session", alias="SESSION_COOKIE_NAME")
     session_max_age: int | None = Field(default=60 * 60 * 24 * 14, alias="SESSION_MAX_AGE")
@@ -132,16 +135,9 @@ class Settings(BaseSettings):
     @field_validator("environment", mode="before")
     @classmethod
     def _normalise_environment(cls, value: object) -> EnvironmentName:
-        if isinstance(value, str):
-            normalized = value.strip().lower()
-        else:
-            normalized = ""
-        if not normalized:
-            normalized = "development"
-        mapped = _ENVIRONMENT_ALIASES.get(normalized)
-        if mapped is not None:
-            return mapped
-        return "development"
+        if not isinstance(value, str):
+            return "development"
+        return _ENVIRONMENT_ALIASES.get(value.strip().lower(), "development")
 
     @field_validator("cache_default_ttl_seconds", mode="before")
     @classmethod
@@ -172,9 +168,9 @@ class Settings(BaseSettings):
         """Allow comma separated strings for CORS configuration."""
 
         if isinstance(value, str):
-            return [item.strip() for item in value.split(",") if item.strip()]
+            return [stripped for item in value.split(",") if (stripped := item.strip())]
         if isinstance(value, Sequence):
-            return [str(item) for item in value if str(item).strip()]
+            return [text for item in value if (text := str(item)).strip()]
         return []
 
     @field_validator("job_default_timeout", "job_result_ttl_seconds", "job_max_retries", mode="before")
@@ -208,9 +204,7 @@ class Settings(BaseSettings):
     @field_validator("log_level", mode="before")
     @classmethod
     def _normalise_log_level(cls, value: object) -> str:
-        if not isinstance(value, str):
-            return "INFO"
-        return value.upper()
+        return value.upper() if isinstance(value, str) else "INFO"
 
     @model_validator(mode="after")
     def _apply_environment_profile(self) -> "Settings":
@@ -224,12 +218,8 @@ class Settings(BaseSettings):
     @field_validator("session_same_site", mode="before")
     @classmethod
     def _normalize_same_site(cls, value: object) -> str:
-        if not isinstance(value, str):
-            return "lax"
-        normalized = value.lower()
-        if normalized not in {"lax", "strict", "none"}:
-            return "lax"
-        return normalized
+        normalized = value.lower() if isinstance(value, str) else "lax"
+        return normalized if normalized in _VALID_SAME_SITE else "lax"
 
 
 @lru_cache()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar, Token
 
 REQUEST_ID_HEADER = "X-Request-ID"
@@ -15,6 +17,11 @@ def get_request_id() -> str:
     return _request_id_ctx_var.get()
 
 
+# Pre-bound accessor for per-record hot paths (e.g. logging filters); calling
+# it is a single C-level ContextVar.get with no Python frame in between.
+request_id_getter = _request_id_ctx_var.get
+
+
 def bind_request_id(request_id: str) -> Token[str]:
     """Bind a request identifier to the current execution context."""
 
@@ -27,6 +34,20 @@ def reset_request_id(token: Token[str]) -> None:
     _request_id_ctx_var.reset(token)
 
 
+@contextmanager
+def bound_request_id(request_id: str) -> Iterator[str]:
+    """Bind a request identifier for the duration of a ``with`` block.
+
+    Keeps the reset token internal so callers do not carry it around.
+    """
+
+    token = _request_id_ctx_var.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id_ctx_var.reset(token)
+
+
 def clear_request_id() -> None:
     """Explicitly clear any request identifier from the current context."""
 
@@ -36,7 +57,9 @@ def clear_request_id() -> None:
 __all__ = [
     "REQUEST_ID_HEADER",
     "bind_request_id",
+    "bound_request_id",
     "clear_request_id",
     "get_request_id",
+    "request_id_getter",
     "reset_request_id",
 ]
@@ -3,27 +3,33 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from threading import Lock
 from typing import Any, TypeVar
 from uuid import uuid4
 
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
 from redis.exceptions import RedisError
 from rq import Queue
 from rq.job import Job, Retry
 
-from .config import get_settings
+from .config import Settings, get_settings
 from .context import get_request_id
 
 logger = logging.getLogger("projects.02-intermediate.app.core.jobs")
 
 T = TypeVar("T")
 
+_job_pool: BlockingConnectionPool | None = None
 _job_connection: Redis | None = None
 _job_queue: Queue | None = None
 _job_lock = Lock()
+_job_retry: Retry | None = None
+_job_retry_resolved = False
+
+# Upper bound on jobs pushed per Redis pipeline when bulk-enqueueing.
+_BULK_ENQUEUE_CHUNK_SIZE = 10_000
 _job_session_factory: Callable[[], AbstractAsyncContextManager["AsyncSession"]] | None = None
 
 
@@ -34,16 +40,19 @@ class JobQueueUnavailableError(RuntimeError):
 def set_job_connection(connection: Redis | None) -> None:
     """Inject a Redis connection for job queue operations (primarily for tests)."""
 
-    global _job_connection, _job_queue
+    global _job_pool, _job_connection, _job_queue, _job_retry, _job_retry_resolved
     with _job_lock:
+        _job_pool = None
         _job_connection = connection
         _job_queue = None
+        _job_retry = None
+        _job_retry_resolved = False
 
 
 def close_job_connection() -> None:
-    """Close the active Redis connection if one exists."""
+    """Close the active Redis connection and pool if they exist."""
 
-    global _job_connection, _job_queue
+    global _job_pool, _job_connection, _job_queue, _job_retry, _job_retry_resolved
     with _job_lock:
         connection = _job_connection
         if connection is not None:
@@ -51,8 +60,17 @@ def close_job_connection() -> None:
                 connection.close()
             except Exception:  # pragma: no cover - closing failures are best-effort
                 logger.debug("Failed to close Redis connection cleanly.", exc_info=True)
+        pool = _job_pool
+        if pool is not None:
+            try:
+                pool.disconnect()
+            except Exception:  # pragma: no cover - closing failures are best-effort
+                logger.debug("Failed to disconnect Redis pool cleanly.", exc_info=True)
+        _job_pool = None
         _job_connection = None
         _job_queue = None
+        _job_retry = None
+        _job_retry_resolved = False
 
 
 def set_job_session_factory(
@@ -65,11 +83,19 @@ def set_job_session_factory(
         _job_session_factory = factory
 
 
+_async_session_maker: Callable[[], AbstractAsyncContextManager["AsyncSession"]] | None = None
+
+
 @asynccontextmanager
 async def _default_job_session_factory() -> AsyncIterator["AsyncSession"]:
-    from ..db.session import async_session_maker  # Local import to avoid circular dependency
-
-    async with async_session_maker() as session:
+    # Resolved lazily (importing db.session at module load would create the
+    # engine as a side effect) but only once: after the first job the maker is
+    # a plain module-global read instead of a per-call import.
+    global _async_session_maker
+    if _async_session_maker is None:
+        from ..db.session import async_session_maker as _async_session_maker
+
+    async with _async_session_maker() as session:
         yield session
 
 
@@ -83,14 +109,57 @@ async def execute_in_job_session(
         return await callback(session)
 
 
-def _resolve_job_connection() -> Redis:
+def _resolve_pool_locked(settings: Settings) -> BlockingConnectionPool:
+    """Build or return the shared pool. The caller must hold ``_job_lock``."""
+
+    global _job_pool
+    if _job_pool is None:
+        # A bounded blocking pool with keep-alive: concurrent enqueues wait
+        # for a free connection instead of growing the pool without limit,
+        # established sockets are reused across enqueues, and periodic
+        # health checks keep idle sockets warm between bursts.
+        _job_pool = BlockingConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            socket_keepalive=True,
+            health_check_interval=settings.redis_health_check_interval,
+        )
+    return _job_pool
+
+
+def get_redis_pool(settings: Settings | None = None) -> BlockingConnectionPool:
+    """Return the process-global Redis connection pool, creating it lazily.
+
+    Exposed so other synchronous Redis clients in the process can share
+    the pool with RQ enqueues and the worker rather than opening sockets
+    of their own.
+    """
+
+    pool = _job_pool
+    if pool is not None:
+        return pool
+    with _job_lock:
+        return _resolve_pool_locked(settings or get_settings())
+
+
+def _resolve_job_connection(settings: Settings | None = None) -> Redis:
     global _job_connection
+
+    # Double-checked locking: module-global assignment is atomic under the
+    # GIL, so the steady-state read needs no mutex and enqueues from many
+    # threads stop serialising on _job_lock.
+    connection = _job_connection
+    if connection is not None:
+        return connection
+
     with _job_lock:
         if _job_connection is not None:
             return _job_connection
-        settings = get_settings()
+        if settings is None:
+            settings = get_settings()
         try:
-            connection = Redis.from_url(settings.redis_url)
+            connection = Redis(connection_pool=_resolve_pool_locked(settings))
             connection.ping()
         except RedisError as exc:  # pragma: no cover - network failures
             logger.error("Redis job queue unavailable.", exc_info=True)
@@ -100,18 +169,23 @@ def _resolve_job_connection() -> Redis:
             return connection
 
 
-def _resolve_job_queue() -> Queue:
+def _resolve_job_queue(settings: Settings | None = None) -> Queue:
     global _job_queue
-    with _job_lock:
-        if _job_queue is not None:
-            return _job_queue
-        connection = _resolve_job_connection()
-        settings = get_settings()
-        timeout = settings.job_default_timeout or None
-        queue = Queue(settings.job_queue_name, connection=connection, default_timeout=timeout)
-        _job_queue = queue
+
+    queue = _job_queue
+    if queue is not None:
         return queue
 
+    if settings is None:
+        settings = get_settings()
+    connection = _resolve_job_connection(settings)
+
+    with _job_lock:
+        if _job_queue is None:
+            timeout = settings.job_default_timeout or None
+            _job_queue = Queue(settings.job_queue_name, connection=connection, default_timeout=timeout)
+        return _job_queue
+
 
 def get_job_connection() -> Redis:
     """Return the Redis connection used for job processing."""
@@ -125,27 +199,46 @@ def get_job_queue() -> Queue:
     return _resolve_job_queue()
 
 
+def _normalise_correlation_id(request_id: str | None) -> str | None:
+    candidate = request_id or get_request_id()
+    if isinstance(candidate, str):
+        normalized = candidate.strip()
+        return normalized if normalized and normalized != "-" else None
+    return None  # pragma: no cover - defensive
+
+
+def _report_retry_policy(settings: Settings) -> Retry | None:
+    """Return the cached retry policy, building it on first use.
+
+    The policy only depends on configuration, so it is computed once and
+    reset alongside the connection in set_job_connection/close_job_connection.
+    """
+
+    global _job_retry, _job_retry_resolved
+    if _job_retry_resolved:
+        return _job_retry
+    with _job_lock:
+        if not _job_retry_resolved:
+            if settings.job_max_retries > 0:
+                intervals = settings.job_retry_backoff_seconds or [0]
+                _job_retry = Retry(max=settings.job_max_retries, interval=intervals)
+            else:
+                _job_retry = None
+            _job_retry_resolved = True
+        return _job_retry
+
+
 def enqueue_task_report(owner_id: int, *, request_id: str | None = None) -> Job:
     """Enqueue a task report generation job for the supplied owner."""
 
     from ..jobs.reporting import generate_task_report_job
 
-    queue = _resolve_job_queue()
     settings = get_settings()
+    queue = _resolve_job_queue(settings)
 
-    correlation_candidate = request_id or get_request_id()
-    correlation_id: str | None
-    if isinstance(correlation_candidate, str):
-        normalized = correlation_candidate.strip()
-        correlation_id = normalized if normalized and normalized != "-" else None
-    else:  # pragma: no cover - defensive
-        correlation_id = None
-
-    job_id = correlation_id or f"task-report:{owner_id}:{uuid4()}"
-    retry: Retry | None = None
-    if settings.job_max_retries > 0:
-        intervals = settings.job_retry_backoff_seconds or [0]
-        retry = Retry(max=settings.job_max_retries, interval=intervals)
+    correlation_id = _normalise_correlation_id(request_id)
+    job_id = correlation_id or f"task-report:{owner_id}:{uuid4().hex}"
+    retry = _report_retry_policy(settings)
     result_ttl = settings.job_result_ttl_seconds or None
     timeout = settings.job_default_timeout or None
 
@@ -181,13 +274,76 @@ def enqueue_task_report(owner_id: int, *, request_id: str | None = None) -> Job:
     return job
 
 
+def enqueue_task_reports(
+    owner_ids: Sequence[int],
+    *,
+    request_id: str | None = None,
+) -> list[Job]:
+    """Enqueue report jobs for many owners using pipelined bulk writes.
+
+    All jobs in a chunk are pushed through a single Redis pipeline, so the
+    fan-out costs one round trip per chunk instead of one per owner.
+    """
+
+    from ..jobs.reporting import generate_task_report_job
+
+    if not owner_ids:
+        return []
+
+    settings = get_settings()
+    queue = _resolve_job_queue(settings)
+
+    correlation_id = _normalise_correlation_id(request_id)
+    retry = _report_retry_policy(settings)
+    result_ttl = settings.job_result_ttl_seconds or None
+    timeout = settings.job_default_timeout or None
+    meta = {"request_id": correlation_id} if correlation_id is not None else None
+    kwargs = {"request_id": correlation_id} if correlation_id is not None else None
+
+    job_datas = [
+        Queue.prepare_data(
+            generate_task_report_job,
+            args=(owner_id,),
+            kwargs=kwargs,
+            timeout=timeout,
+            result_ttl=result_ttl,
+            failure_ttl=result_ttl,
+            description=f"Generate task report for owner {owner_id}",
+            job_id=f"task-report:{owner_id}:{uuid4().hex}",
+            meta=meta,
+            retry=retry,
+        )
+        for owner_id in owner_ids
+    ]
+
+    jobs: list[Job] = []
+    try:
+        for start in range(0, len(job_datas), _BULK_ENQUEUE_CHUNK_SIZE):
+            chunk = job_datas[start : start + _BULK_ENQUEUE_CHUNK_SIZE]
+            with queue.connection.pipeline(transaction=False) as pipeline:
+                jobs.extend(queue.enqueue_many(chunk, pipeline=pipeline))
+                pipeline.execute()
+    except RedisError as exc:  # pragma: no cover - network failures
+        logger.error("Failed to bulk-enqueue task report jobs.", exc_info=True)
+        raise JobQueueUnavailableError("Unable to enqueue jobs; Redis is unavailable.") from exc
+
+    logger.info(
+        "Enqueued %d task report jobs.",
+        len(jobs),
+        extra={"queue": queue.name, "owner_count": len(owner_ids)},
+    )
+    return jobs
+
+
 __all__ = [
     "JobQueueUnavailableError",
     "close_job_connection",
     "enqueue_task_report",
+    "enqueue_task_reports",
     "execute_in_job_session",
     "get_job_connection",
     "get_job_queue",
+    "get_redis_pool",
     "set_job_connection",
     "set_job_session_factory",
 ]
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import json
 import logging
-import logging.config
-from datetime import datetime, timezone
+import sys
+import time
+from functools import partial
 from typing import Any
 
 from .config import Settings
-from .context import get_request_id
+from .context import request_id_getter
+
+# Single pre-bound encoder for the hot formatting path: compact separators
+# avoid per-record whitespace, and default=str covers non-JSON values in one
+# pass instead of probing each extra separately.
+_dump_json = partial(json.dumps, ensure_ascii=False, separators=(",", ":"), default=str)
 
 _RESERVED_LOG_RECORD_ATTRS = {
     "name",
@@ -33,8 +39,54 @@ _RESERVED_LOG_RECORD_ATTRS = {
     "processName",
     "process",
     "message",
+    "taskName",
 }
 
+# Payload keys the record controls even when a formatter default collides.
+_RECORD_CONTROLLED_KEYS = frozenset(
+    {"timestamp", "level", "logger", "message", "request_id", "exception", "stack"}
+)
+
+# Every attribute a plain LogRecord carries after RequestContextFilter ran.
+# Records whose keys are a subset of this set have no extras to scan for.
+_PLAIN_RECORD_ATTRS = frozenset(_RESERVED_LOG_RECORD_ATTRS) | {"request_id"}
+
+# Loggers that receive the shared handler directly and stop propagating.
+_DEDICATED_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access", "rq", "rq.worker")
+
+# The date prefix for the current UTC day, keyed by day number since the
+# epoch: consecutive records almost always share a day, so the formatter
+# only pays for time.gmtime once per day per process.
+_day_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_utc(ts: float) -> str:
+    """Format an epoch timestamp as an ISO-8601 UTC string.
+
+    Equivalent to ``datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()``
+    without constructing a datetime per record.
+    """
+
+    global _day_cache
+    seconds = int(ts)
+    microseconds = round((ts - seconds) * 1_000_000)
+    if microseconds == 1_000_000:
+        seconds += 1
+        microseconds = 0
+    day, remainder = divmod(seconds, 86400)
+    cached_day, date_part = _day_cache
+    if day != cached_day:
+        tm = time.gmtime(seconds)
+        date_part = "%04d-%02d-%02d" % (tm.tm_year, tm.tm_mon, tm.tm_mday)
+        _day_cache = (day, date_part)
+    return "%sT%02d:%02d:%02d.%06d+00:00" % (
+        date_part,
+        remainder // 3600,
+        remainder // 60 % 60,
+        remainder % 60,
+        microseconds,
+    )
+
 
 class JsonLogFormatter(logging.Formatter):
     """Render log records as structured JSON objects."""
@@ -49,45 +101,96 @@ class JsonLogFormatter(logging.Formatter):
     ) -> None:
         super().__init__(fmt=fmt, datefmt=datefmt, style=style)
         self._defaults = defaults or {}
+        self._default_keys = frozenset(self._defaults)
+        # Defaults never change after configuration, so encode them once and
+        # splice per-record JSON onto the prefix instead of copying and
+        # re-encoding the same keys on every line.
+        self._defaults_prefix = _dump_json(self._defaults)[:-1] if self._defaults else ""
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
-        payload: dict[str, Any] = dict(self._defaults)
-        payload.update(
-            {
-                "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
-                "level": record.levelname,
-                "logger": record.name,
-                "message": record.getMessage(),
-                "request_id": getattr(record, "request_id", "-"),
-            }
-        )
-
-        for key, value in record.__dict__.items():
-            if key in _RESERVED_LOG_RECORD_ATTRS or key == "request_id":
-                continue
-            payload.setdefault(key, self._coerce_extra(value))
+        payload: dict[str, Any] = {
+            "timestamp": _iso_utc(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            # RequestContextFilter always runs ahead of the formatter and sets
+            # this attribute, so plain access skips getattr's default handling.
+            "request_id": record.request_id,
+        }
+
+        attrs = record.__dict__
+        if not attrs.keys() <= _PLAIN_RECORD_ATTRS:
+            for key, value in attrs.items():
+                if key in _RESERVED_LOG_RECORD_ATTRS or key == "request_id":
+                    continue
+                payload.setdefault(key, value)
 
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
         if record.stack_info:
             payload["stack"] = self.formatStack(record.stack_info)
 
-        return json.dumps(payload, ensure_ascii=False, default=str)
+        if self._defaults and not self._default_keys.isdisjoint(payload):
+            # Rare conflict between a default and a record key: fall back to a
+            # full merge where, as before, defaults win over extras but not
+            # over the record-controlled fields.
+            merged = dict(self._defaults)
+            for key, value in payload.items():
+                if key in _RECORD_CONTROLLED_KEYS or key not in merged:
+                    merged[key] = value
+            payload = merged
 
-    @staticmethod
-    def _coerce_extra(value: Any) -> Any:
         try:
-            json.dumps(value)
-        except TypeError:
-            return str(value)
-        return value
+            serialized = _dump_json(payload)
+            if self._defaults_prefix and self._default_keys.isdisjoint(payload):
+                return f"{self._defaults_prefix},{serialized[1:]}"
+            return serialized
+        except (TypeError, ValueError):  # pragma: no cover - pathological extras
+            return _dump_json(
+                {
+                    key: value if isinstance(value, (str, int, float, bool)) or value is None else repr(value)
+                    for key, value in payload.items()
+                }
+            )
+
+
+class BytesStreamHandler(logging.StreamHandler):
+    """Stream handler that writes to the stream's binary buffer when it has one.
+
+    Writing pre-encoded UTF-8 bytes to ``sys.stdout.buffer`` sidesteps the
+    ``TextIOWrapper`` encode/translate machinery per log line. Text streams
+    without a buffer (e.g. an ``io.StringIO`` swapped in via ``setStream``)
+    fall back to the inherited text path.
+    """
+
+    def __init__(self, stream: Any | None = None) -> None:
+        super().__init__(stream)
+        self._buffer = getattr(self.stream, "buffer", None)
+
+    def setStream(self, stream: Any) -> Any | None:  # noqa: N802 - stdlib API
+        result = super().setStream(stream)
+        self._buffer = getattr(self.stream, "buffer", None)
+        return result
+
+    def emit(self, record: logging.LogRecord) -> None:  # type: ignore[override]
+        buffer = self._buffer
+        if buffer is None:
+            super().emit(record)
+            return
+        try:
+            buffer.write(self.format(record).encode("utf-8") + b"\n")
+            buffer.flush()
+        except RecursionError:  # pragma: no cover - stdlib convention
+            raise
+        except Exception:  # pragma: no cover - delegated to stdlib error handling
+            self.handleError(record)
 
 
 class RequestContextFilter(logging.Filter):
     """Attach request correlation identifiers to emitted log records."""
 
     def filter(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
-        record.request_id = get_request_id()
+        record.request_id = request_id_getter()
         return True
 
 
@@ -97,50 +200,26 @@ def configure_logging(settings: Settings) -> None:
     level = getattr(logging, settings.log_level.upper(), logging.INFO)
     logging.captureWarnings(True)
 
-    formatter_path = "projects.02-intermediate.app.core.logging.JsonLogFormatter"
-    config: dict[str, Any] = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "json": {
-                "()": formatter_path,
-                "defaults": {
-                    "service": settings.project_name,
-                    "environment": settings.environment,
-                },
+    # Wire the primitives directly instead of paying dictConfig's schema
+    # validation and string-resolution pass on every (re)configuration.
+    handler = BytesStreamHandler(sys.stdout)
+    handler.setLevel(level)
+    handler.setFormatter(
+        JsonLogFormatter(
+            defaults={
+                "service": settings.project_name,
+                "environment": settings.environment,
             }
-        },
-        "filters": {
-            "request_context": {"()": RequestContextFilter},
-        },
-        "handlers": {
-            "default": {
-                "class": "logging.StreamHandler",
-                "stream": "ext://sys.stdout",
-                "formatter": "json",
-                "level": level,
-                "filters": ["request_context"],
-            }
-        },
-        "loggers": {
-            "": {"handlers": ["default"], "level": level},
-            "uvicorn": {"handlers": ["default"], "level": level, "propagate": False},
-            "uvicorn.error": {
-                "handlers": ["default"],
-                "level": level,
-                "propagate": False,
-            },
-            "uvicorn.access": {
-                "handlers": ["default"],
-                "level": level,
-                "propagate": False,
-            },
-            "rq": {"handlers": ["default"], "level": level, "propagate": False},
-            "rq.worker": {
-                "handlers": ["default"],
-                "level": level,
-                "propagate": False,
-            },
-        },
-    }
-    logging.config.dictConfig(config)
+        )
+    )
+    handler.addFilter(RequestContextFilter())
+
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [handler]
+    root_logger.setLevel(level)
+
+    for name in _DEDICATED_LOGGERS:
+        dedicated = logging.getLogger(name)
+        dedicated.handlers[:] = [handler]
+        dedicated.setLevel(level)
+        dedicated.propagate = False
@@ -8,7 +8,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from .context import REQUEST_ID_HEADER, bind_request_id, reset_request_id
+from .context import REQUEST_ID_HEADER, bound_request_id
 
 
 class CorrelationIdMiddleware(BaseHTTPMiddleware):
@@ -20,18 +20,17 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next) -> Response:  # type: ignore[override]
         request_id = request.headers.get(self._header_name) or self._generate_request_id()
-        token = bind_request_id(request_id)
         request.state.request_id = request_id
-        try:
+        with bound_request_id(request_id):
             response = await call_next(request)
-        finally:
-            reset_request_id(token)
         response.headers.setdefault(self._header_name, request_id)
         return response
 
     @staticmethod
     def _generate_request_id() -> str:
-        return str(uuid.uuid4())
+        # .hex skips UUID.__str__'s hyphen formatting; this runs for every
+        # request that arrives without a correlation header.
+        return uuid.uuid4().hex
 
 
 __all__ = ["CorrelationIdMiddleware"]
@@ -12,12 +12,14 @@ def get_session_user_id(session: MutableMapping[str, Any]) -> int | None:
     """Return the authenticated user's identifier stored in the session."""
 
     raw = session.get(SESSION_USER_KEY)
+    # Exact-type check first: login_user always stores an int, so this is the
+    # steady-state path and skips isinstance's MRO walk.
+    if type(raw) is int:
+        return raw
     if raw is None:
         return None
-    if isinstance(raw, int):
-        return raw
     try:
-        return int(str(raw))
+        return int(raw)
     except (TypeError, ValueError):  # pragma: no cover - defensive guard
         return None
 
@@ -66,9 +68,8 @@ def add_flash_message(session: MutableMapping[str, Any], category: str, message:
     existing = session.get(SESSION_FLASH_KEY)
     if isinstance(existing, list):
         existing.append(payload)
-        session[SESSION_FLASH_KEY] = existing
-        return
-    session[SESSION_FLASH_KEY] = [payload]
+    else:
+        session[SESSION_FLASH_KEY] = [payload]
 
 
 def pop_flash_messages(session: MutableMapping[str, Any]) -> list[dict[str, str]]:
@@ -77,16 +78,11 @@ def pop_flash_messages(session: MutableMapping[str, Any]) -> list[dict[str, str]
     messages = session.pop(SESSION_FLASH_KEY, [])
     if not isinstance(messages, list):
         return []
-    cleaned: list[dict[str, str]] = []
-    for item in messages:
-        if not isinstance(item, dict):
-            continue
-        category = str(item.get("category", "info"))
-        message = str(item.get("message", ""))
-        if not message:
-            continue
-        cleaned.append({"category": category, "message": message})
-    return cleaned
+    return [
+        {"category": str(item.get("category", "info")), "message": message}
+        for item in messages
+        if isinstance(item, dict) and (message := str(item.get("message", "")))
+    ]
 
 
 __all__ = [
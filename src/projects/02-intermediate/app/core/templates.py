@@ -6,7 +6,7 @@ from typing import Any
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
 
-from .session import ensure_csrf_token, pop_flash_messages
+from .session import SESSION_CSRF_KEY, ensure_csrf_token, pop_flash_messages
 
 TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
 
@@ -25,15 +25,24 @@ def _base_context(
     extra: dict[str, Any] | None = None,
     *,
     include_messages: bool = True,
+    needs_csrf: bool = True,
 ) -> dict[str, Any]:
-    context = dict(extra or {})
+    # ``extra`` is filled in place when provided: callers build it per request
+    # and discard it after rendering, so copying it would only create garbage.
+    context = extra if extra is not None else {}
     session = request.session
 
     context.setdefault("request", request)
     context.setdefault("settings", getattr(request.app.state, "settings", None))
     context.setdefault("current_user", None)
-    context["csrf_token"] = ensure_csrf_token(session)
-    context["is_htmx"] = is_htmx_request(request)
+    if needs_csrf:
+        context["csrf_token"] = ensure_csrf_token(session)
+    else:
+        # Read-only fragments reuse an existing token but never pay for
+        # generating one (a CSPRNG call plus a session write).
+        token = session.get(SESSION_CSRF_KEY)
+        context["csrf_token"] = token if isinstance(token, str) else ""
+    context["is_htmx"] = request.headers.get("HX-Request", "").lower() == "true"
 
     if include_messages:
         context["messages"] = pop_flash_messages(session)
@@ -62,10 +71,11 @@ def partial_response(
     context: dict[str, Any] | None = None,
     *,
     status_code: int = 200,
+    needs_csrf: bool = True,
 ) -> Any:
     """Render a fragment without consuming queued flash messages."""
 
-    payload = _base_context(request, context, include_messages=False)
+    payload = _base_context(request, context, include_messages=False, needs_csrf=needs_csrf)
     return _templates.TemplateResponse(template_name, payload, status_code=status_code)
 
 
@@ -12,10 +12,24 @@ from ..core.config import get_settings
 
 settings = get_settings()
 
+# SQLite (used for local experiments) manages its own pooling and rejects
+# queue-pool sizing arguments, so the tuning only applies to server databases.
+_pool_kwargs: dict[str, object] = {}
+if not settings.database_url.startswith("sqlite"):
+    _pool_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        # LIFO checkout keeps a small set of connections hot during bursts
+        # and lets the remainder age out via pool_recycle.
+        "pool_use_lifo": True,
+    }
+
 engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=settings.db_echo,
     pool_pre_ping=True,
+    **_pool_kwargs,
 )
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
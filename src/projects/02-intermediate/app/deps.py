@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 from typing import Annotated, Awaitable
 
 from fastapi import Depends, HTTPException, Request, status
@@ -8,26 +9,83 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from pydantic import ValidationError
 from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import FormData
 
 from .activity import ActivityLogService
 from .core.config import Settings, get_settings
 from .core.security import TokenType, decode_token, is_token_blacklisted
-from .core.session import get_session_user_id
+from .core.session import SESSION_CSRF_KEY, get_session_user_id, validate_csrf_token
 from .db.session import get_session
 from .models import User, UserRole
 from .repositories import UserRepository
 from .schemas.auth import TokenPayload
+from .services.auth import AuthService
+from .services.tasks import TaskService
 
 SettingsDependency = Annotated[Settings, Depends(get_settings)]
 DatabaseSessionDependency = Annotated[AsyncSession, Depends(get_session)]
 
 
+def get_task_service(session: DatabaseSessionDependency) -> TaskService:
+    return TaskService(session)
+
+
+TaskServiceDependency = Annotated[TaskService, Depends(get_task_service)]
+
+
+def get_auth_service(session: DatabaseSessionDependency, settings: SettingsDependency) -> AuthService:
+    return AuthService(session, settings)
+
+
+AuthServiceDependency = Annotated[AuthService, Depends(get_auth_service)]
+
+
 def get_activity_log_service() -> ActivityLogService:
     return ActivityLogService()
 
 
 ActivityServiceDependency = Annotated[ActivityLogService, Depends(get_activity_log_service)]
 
+_EMPTY_FORM = FormData()
+
+
+@dataclass(slots=True)
+class ValidatedForm:
+    """Parsed form data plus the outcome of the CSRF validation."""
+
+    form: FormData
+    csrf_ok: bool
+
+
+async def get_validated_form(request: Request, settings: SettingsDependency) -> ValidatedForm:
+    """Validate CSRF preconditions before draining the request body.
+
+    Oversized bodies and sessions without a CSRF token are rejected without
+    parsing the form at all, so bots hammering the POST endpoints cannot make
+    the server buffer multipart payloads that will fail validation anyway.
+    """
+
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            return ValidatedForm(form=_EMPTY_FORM, csrf_ok=False)
+        if declared > settings.max_form_bytes:
+            return ValidatedForm(form=_EMPTY_FORM, csrf_ok=False)
+
+    if not request.session.get(SESSION_CSRF_KEY):
+        return ValidatedForm(form=_EMPTY_FORM, csrf_ok=False)
+
+    form = await request.form()
+    return ValidatedForm(
+        form=form,
+        csrf_ok=validate_csrf_token(request.session, form.get("csrf_token")),
+    )
+
+
+ValidatedFormDependency = Annotated[ValidatedForm, Depends(get_validated_form)]
+
 _oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
@@ -148,14 +206,21 @@ AuthenticatedSessionUserDependency = Annotated[User, Depends(require_session_use
 __all__ = [
     "ActivityServiceDependency",
     "AdminUserDependency",
+    "AuthServiceDependency",
     "AuthenticatedSessionUserDependency",
     "CurrentUserDependency",
     "DatabaseSessionDependency",
     "SessionUserDependency",
     "SettingsDependency",
+    "TaskServiceDependency",
+    "ValidatedForm",
+    "ValidatedFormDependency",
     "get_activity_log_service",
+    "get_auth_service",
     "get_db_session",
+    "get_task_service",
     "get_session_user",
+    "get_validated_form",
     "require_current_user",
     "require_session_user",
 ]
@@ -14,8 +14,7 @@ from sqlalchemy.exc import IntegrityError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.requests import Request
 
-from .core.context import REQUEST_ID_HEADER, bind_request_id, reset_request_id
-from .schemas.system import ErrorResponse
+from .core.context import REQUEST_ID_HEADER, bind_request_id, get_request_id, reset_request_id
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +110,10 @@ class ServerError(ApplicationError):
         )
 
 
+# Reason phrases for every known status code, so the handlers never pay for
+# an HTTPStatus enum construction (and its ValueError path) per error.
+_STATUS_PHRASES: dict[int, str] = {int(member): member.phrase for member in HTTPStatus}
+
 _HTTP_STATUS_CODE_MAP: dict[int, str] = {
     status.HTTP_400_BAD_REQUEST: "bad_request",
     status.HTTP_401_UNAUTHORIZED: "unauthorized",
@@ -126,6 +129,11 @@ def _bind_request_context(request: Request) -> Token[str] | None:
     request_id = getattr(request.state, "request_id", None)
     if not request_id:
         return None
+    if get_request_id() == request_id:
+        # The correlation middleware already bound this id in the current
+        # task (the usual case); rebinding it to itself would only allocate
+        # a Token for the matching reset.
+        return None
     return bind_request_id(request_id)
 
 
@@ -149,9 +157,13 @@ def _merge_details_with_request(request: Request, details: Any | None) -> Any |
     if details is None:
         return {"request_id": request_id}
     if isinstance(details, dict):
-        if "request_id" not in details:
-            return {**details, "request_id": request_id}
-        return details
+        if "request_id" in details:
+            return details
+        # dict.copy sizes the result in one C call; {**d, ...} unpacking pays
+        # for generic iteration, which adds up on wide validation payloads.
+        merged = details.copy()
+        merged["request_id"] = request_id
+        return merged
     return {"request_id": request_id, "detail": details}
 
 
@@ -164,12 +176,16 @@ def _error_response(
     details: Any | None = None,
     headers: Mapping[str, str] | None = None,
 ) -> JSONResponse:
-    payload = ErrorResponse(
-        code=code,
-        message=message,
-        details=_merge_details_with_request(request, details),
-    )
-    response = JSONResponse(status_code=status_code, content=payload.model_dump())
+    # Built as a plain dict matching the documented ErrorResponse schema; the
+    # handler controls every field, so validating and model_dump-ing a pydantic
+    # instance per error would only re-traverse the payload before JSONResponse
+    # serialises it.
+    payload = {
+        "code": code,
+        "message": message,
+        "details": _merge_details_with_request(request, details),
+    }
+    response = JSONResponse(status_code=status_code, content=payload)
     if headers:
         response.headers.update(headers)
     request_id = getattr(request.state, "request_id", None)
@@ -184,10 +200,7 @@ def _http_exception_details(
 ) -> tuple[str, Any | None]:
     if isinstance(detail, str):
         return detail, None
-    try:
-        status_phrase = HTTPStatus(status_code).phrase
-    except ValueError:
-        status_phrase = "Error"
+    status_phrase = _STATUS_PHRASES.get(status_code, "Error")
     if detail is None:
         return status_phrase, None
     return status_phrase, _normalize_details(detail)
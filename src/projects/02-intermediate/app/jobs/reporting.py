@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
-from typing import Any
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -15,17 +15,42 @@ from ..schemas.report import TaskReportRead
 
 logger = logging.getLogger("projects.02-intermediate.app.jobs.reporting")
 
+# One event loop shared across every job this worker processes. asyncio.run
+# per job would rebuild the loop (and tear down the async engine's pooled
+# connections with it) each time; reusing the loop keeps them alive.
+_worker_loop: asyncio.AbstractEventLoop | None = None
 
-async def _generate_task_report(owner_id: int) -> TaskReportRead:
-    async def _invoke(session: AsyncSession) -> TaskReportRead:
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+@atexit.register
+def _close_worker_loop() -> None:
+    global _worker_loop
+    loop = _worker_loop
+    _worker_loop = None
+    if loop is not None and not loop.is_closed():
+        loop.close()
+
+
+async def _generate_task_report(owner_id: int) -> bytes:
+    async def _invoke(session: AsyncSession) -> bytes:
         service = TaskReportService(session)
         report = await service.generate_report(owner_id)
-        return TaskReportRead.model_validate(report)
+        # Serialised once, in Rust, straight to the JSON the caller wants;
+        # returning a dict here would make RQ pickle the whole object graph
+        # into Redis only for consumers to re-encode it.
+        return TaskReportRead.model_validate(report).model_dump_json().encode()
 
     return await execute_in_job_session(_invoke)
 
 
-def generate_task_report_job(owner_id: int, request_id: str | None = None) -> dict[str, Any]:
+def generate_task_report_job(owner_id: int, request_id: str | None = None) -> bytes:
     """Generate and persist a summary report for a user's tasks."""
 
     if owner_id <= 0:
@@ -38,8 +63,7 @@ def generate_task_report_job(owner_id: int, request_id: str | None = None) -> di
         clear_request_id()
 
     try:
-        result = asyncio.run(_generate_task_report(owner_id))
-        payload = result.model_dump()
+        payload = _get_worker_loop().run_until_complete(_generate_task_report(owner_id))
         logger.info(
             "Generated task report for owner %s",
             owner_id,
@@ -28,6 +28,10 @@ class TimestampMixin(SQLModel, table=False):
         sa_type=sa.DateTime(timezone=True),
         sa_column_kwargs={
             "server_default": sa.func.now(),
+            # Client-side onupdate keeps the column maintained by plain Core
+            # UPDATE statements too, so mutations never need a follow-up
+            # SELECT/refresh just to observe the new timestamp.
+            "onupdate": utcnow,
             "server_onupdate": sa.func.now(),
         },
     )
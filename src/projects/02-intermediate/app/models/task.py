@@ -58,6 +58,8 @@ class Task(TaskBase, TimestampMixin, table=True):
     __table_args__ = (
         sa.CheckConstraint("length(title) > 0", name="ck_tasks_title_length"),
         sa.Index("ix_tasks_owner_id", "owner_id"),
+        # Covers the per-owner GROUP BY status aggregate used for reports.
+        sa.Index("ix_tasks_owner_id_status", "owner_id", "status"),
     )
 
     id: int | None = Field(default=None, primary_key=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Generic, TypeVar
 
 from sqlmodel import SQLModel, select
@@ -9,6 +10,9 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+#: Server-side cursor batch size used by the streaming helpers.
+STREAM_BATCH_SIZE = 200
+
 
 class BaseRepository(Generic[ModelType]):
     """Provide shared persistence helpers for repositories."""
@@ -31,6 +35,18 @@ class BaseRepository(Generic[ModelType]):
         result = await self._session.execute(select(self._model_type))
         return list(result.scalars().all())
 
+    async def stream(self) -> AsyncIterator[ModelType]:
+        """Iterate over all entities without materialising the full list.
+
+        Rows are fetched in ``STREAM_BATCH_SIZE`` batches over a streaming
+        result, capping peak memory for large exports; template-facing
+        callers should keep using :meth:`list`.
+        """
+        statement = select(self._model_type).execution_options(yield_per=STREAM_BATCH_SIZE)
+        result = await self._session.stream_scalars(statement)
+        async for instance in result:
+            yield instance
+
     async def add(self, instance: ModelType) -> ModelType:
         """Add and flush a new entity instance."""
         self._session.add(instance)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from sqlalchemy import lambda_stmt
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -16,7 +17,10 @@ class TaskReportRepository(BaseRepository[TaskReport]):
         super().__init__(session, TaskReport)
 
     async def get_by_owner(self, owner_id: int) -> TaskReport | None:
-        result = await self.session.execute(select(TaskReport).where(TaskReport.owner_id == owner_id))
+        # ``lambda_stmt`` builds the select AST once; subsequent calls only
+        # rebind ``owner_id``, skipping per-call statement construction.
+        statement = lambda_stmt(lambda: select(TaskReport).where(TaskReport.owner_id == owner_id))
+        result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
 
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Row, String, Text, func, insert, lambda_stmt, literal, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..models import Task, TaskStatus
-from .base import BaseRepository
+from ..models import Task, TaskStatus, User
+from .base import STREAM_BATCH_SIZE, BaseRepository
 
 
 class TaskRepository(BaseRepository[Task]):
@@ -23,8 +26,20 @@ class TaskRepository(BaseRepository[Task]):
         status: TaskStatus | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[Task], int]:
-        """Return tasks matching the provided filters along with the total count."""
+        after_id: int | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Task], int | None]:
+        """Return tasks matching the provided filters along with the total count.
+
+        Pages are always ordered newest-first (``id DESC``), so the last id
+        of any page is the page minimum and chains directly into the keyset
+        branch. When ``after_id`` is supplied the page is resolved with
+        keyset (seek) pagination — ``WHERE id < after_id ORDER BY id DESC``
+        — which is an index seek regardless of how deep the page is, unlike
+        ``OFFSET``. The ``COUNT(*)`` is O(N) on PostgreSQL, so it is only
+        issued when ``include_total`` is true; otherwise ``total`` is
+        ``None``.
+        """
         query = select(Task)
         count_query = select(func.count()).select_from(Task)
         if owner_id is not None:
@@ -33,31 +48,126 @@ class TaskRepository(BaseRepository[Task]):
         if status is not None:
             query = query.where(Task.status == status)
             count_query = count_query.where(Task.status == status)
-        query = query.order_by(Task.id).limit(limit).offset(offset)
+        if after_id is not None:
+            query = query.where(Task.id < after_id).order_by(Task.id.desc()).limit(limit)
+        else:
+            query = query.order_by(Task.id.desc()).limit(limit).offset(offset)
         result = await self.session.execute(query)
         tasks = list(result.scalars().all())
-        total_result = await self.session.execute(count_query)
-        total = int(total_result.scalar_one())
+        total: int | None = None
+        if include_total:
+            total_result = await self.session.execute(count_query)
+            total = int(total_result.scalar_one())
         return tasks, total
 
     async def count_by_status(self, *, owner_id: int | None = None) -> dict[TaskStatus, int]:
-        """Return a mapping of task status to the number of matching records."""
+        """Return a mapping of task status to the number of matching records.
 
-        query = select(Task.status, func.count()).select_from(Task)
+        One ``GROUP BY status`` aggregate resolves every counter in a single
+        round trip; the composite ``(owner_id, status)`` index lets the
+        owner-scoped variant run as an index-only scan.
+        """
+
+        query = lambda_stmt(lambda: select(Task.status, func.count()).select_from(Task))
         if owner_id is not None:
-            query = query.where(Task.owner_id == owner_id)
-        query = query.group_by(Task.status)
+            query += lambda s: s.where(Task.owner_id == owner_id)
+        query += lambda s: s.group_by(Task.status)
         result = await self.session.execute(query)
-        counts: dict[TaskStatus, int] = {}
-        for status, count in result.all():
-            counts[status] = int(count)
-        return counts
+        return {status: int(count) for status, count in result}
+
+    async def insert_for_owner(
+        self,
+        *,
+        owner_id: int,
+        title: str,
+        description: str | None,
+        status: TaskStatus,
+    ) -> Task | None:
+        """Insert a task for ``owner_id`` with the existence check folded in.
+
+        ``INSERT ... SELECT ... RETURNING`` sources the owner id from the
+        users table itself, so a missing owner simply inserts zero rows —
+        one round trip instead of a SELECT, an INSERT and a refresh.
+        """
+        source = select(
+            literal(title, String()),
+            literal(description, Text()),
+            literal(status.value, String()),
+            User.id,
+        ).where(User.id == owner_id)
+        statement = (
+            insert(Task)
+            .from_select(["title", "description", "status", "owner_id"], source)
+            .returning(Task)
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
+
+    async def update_returning(
+        self,
+        task_id: int,
+        values: dict[str, Any],
+        *,
+        owner_id: int | None = None,
+    ) -> Task | None:
+        """Apply ``values`` to a task and return the updated row in one query.
+
+        ``UPDATE ... RETURNING`` folds the previous SELECT + UPDATE + refresh
+        sequence into a single round trip. The optional ``owner_id`` becomes a
+        WHERE predicate, so ownership is enforced by the statement itself;
+        ``None`` means no row matched both conditions.
+        """
+        statement = update(Task).where(Task.id == task_id)
+        if owner_id is not None:
+            statement = statement.where(Task.owner_id == owner_id)
+        statement = statement.values(**values).returning(Task)
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
+
+    async def list_rows_for_owner(self, owner_id: int) -> Sequence[Row[Any]]:
+        """Return the owner's tasks as plain Core rows, newest first.
+
+        The list page only reads ``id``/``title``/``description``/``status``,
+        so selecting those columns directly skips ORM instance construction
+        and identity-map bookkeeping; ``Row`` still supports attribute access
+        in the templates.
+        """
+        result = await self.session.execute(
+            select(Task.id, Task.title, Task.description, Task.status)
+            .where(Task.owner_id == owner_id)
+            .order_by(Task.id.desc())
+        )
+        return result.all()
+
+    async def get_owner_id(self, task_id: int) -> int | None:
+        """Return the owner id of a task without hydrating the row."""
+        return await self.session.scalar(select(Task.owner_id).where(Task.id == task_id))
+
+    async def exists(self, task_id: int) -> bool:
+        """Return whether a task row with the given id exists.
+
+        Selects only the primary key, so distinguishing "missing" from
+        "forbidden" does not pay for full row hydration.
+        """
+        result = await self.session.scalar(select(Task.id).where(Task.id == task_id))
+        return result is not None
 
     async def list_for_owner(self, owner_id: int) -> list[Task]:
         """Return all tasks assigned to the given owner."""
         result = await self.session.execute(select(Task).where(Task.owner_id == owner_id))
         return list(result.scalars().all())
 
+    async def stream_for_owner(self, owner_id: int) -> AsyncIterator[Task]:
+        """Iterate over an owner's tasks in batches instead of one big list."""
+        statement = (
+            select(Task)
+            .where(Task.owner_id == owner_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        result = await self.session.stream_scalars(statement)
+        async for task in result:
+            yield task
+
     async def get_for_owner(self, task_id: int, owner_id: int) -> Task | None:
         """Retrieve a task by ID ensuring it belongs to the provided owner."""
         result = await self.session.execute(
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 from typing import Sequence
 
+from sqlalchemy import bindparam
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models import User
 from .base import BaseRepository
 
+# Precompiled with an expanding IN so the compiled-statement cache is reused
+# no matter how many ids a call supplies.
+_LIST_BY_IDS = select(User).where(User.id.in_(bindparam("ids", expanding=True)))
+_IDS_TO_EMAILS = select(User.id, User.email).where(User.id.in_(bindparam("ids", expanding=True)))
+
 
 class UserRepository(BaseRepository[User]):
     """Concrete repository for CRUD operations on ``User`` entities."""
@@ -31,5 +37,16 @@ class UserRepository(BaseRepository[User]):
         """Fetch all users whose IDs are contained in the provided sequence."""
         if not ids:
             return []
-        result = await self.session.execute(select(User).where(User.id.in_(ids)))
+        result = await self.session.execute(_LIST_BY_IDS, {"ids": list(ids)})
         return list(result.scalars().all())
+
+    async def list_ids_to_emails(self, ids: Sequence[int]) -> dict[int, str]:
+        """Map user ids to email addresses without hydrating full ORM rows.
+
+        Intended for bulk display-name resolution where callers only need
+        two columns per user.
+        """
+        if not ids:
+            return {}
+        result = await self.session.execute(_IDS_TO_EMAILS, {"ids": list(ids)})
+        return {user_id: email for user_id, email in result}
@@ -103,9 +103,16 @@ class TaskListResponse(BaseModel):
     )
 
     items: list[TaskRead]
-    total: int
+    total: int | None = Field(default=None)
     limit: int
     offset: int
+    next_cursor: int | None = Field(
+        default=None,
+        description=(
+            "Smallest task id on this newest-first page; pass it as after_id"
+            " to request the following page."
+        ),
+    )
 
 
 class TaskStatistics(BaseModel):
@@ -119,7 +126,9 @@ class TaskStatistics(BaseModel):
 
     @model_validator(mode="after")
     def _validate_counts(self) -> "TaskStatistics":
-        if any(count < 0 for count in self.by_status.values()):
+        # min() over the values view runs the comparison loop in C, unlike
+        # any() driving a Python generator frame per element.
+        if self.by_status and min(self.by_status.values()) < 0:
             raise ValueError("Status counts cannot be negative.")
         return self
 
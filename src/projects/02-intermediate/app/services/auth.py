@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import timezone
 
@@ -69,7 +70,10 @@ class AuthService:
         user = await self._user_service.get_user_by_email(email)
         if user is None:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified = await asyncio.get_running_loop().run_in_executor(
+            None, verify_password, password, user.hashed_password
+        )
+        if not verified:
             return None
         if not user.is_active:
             raise ApplicationError(
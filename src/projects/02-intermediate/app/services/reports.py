@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
+from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..core.cache import (
+    TASK_REPORT_CACHE_NAMESPACE,
+    cache_metrics,
+    get_cache_client,
+    invalidate_report_cache,
+)
+from ..core.config import get_settings
 from ..models import TaskReport, TaskStatus
 from ..models.common import utcnow
 from ..repositories import TaskReportRepository, TaskRepository
 
 logger = logging.getLogger("projects.02-intermediate.app.services.reports")
 
+_REPORT_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext('reports:' || CAST(:owner_id AS text)))")
+
 
 @dataclass(slots=True)
 class TaskReportSummary:
@@ -36,16 +47,86 @@ class TaskReportService:
         self._report_repository = TaskReportRepository(session)
 
     async def get_report(self, owner_id: int) -> TaskReport | None:
-        """Retrieve the latest report for a given owner."""
+        """Retrieve the latest report for a given owner.
+
+        Reports are read-mostly, so hits are served from Redis (write-through
+        invalidated by :meth:`generate_report`) instead of a database round
+        trip. A cached row hydrates to a detached ``TaskReport`` instance.
+        """
+
+        client = await get_cache_client()
+        cache_key = f"{TASK_REPORT_CACHE_NAMESPACE}:{owner_id}"
+        if client is not None:
+            try:
+                cached_payload = await client.get(cache_key)
+            except Exception:  # pragma: no cover - network failure scenarios
+                logger.warning("Failed to read cache key %s; bypassing cache.", cache_key, exc_info=True)
+                cached_payload = None
+            if cached_payload is not None:
+                cache_metrics.record_hit()
+                return TaskReport.model_validate_json(cached_payload)
+            cache_metrics.record_miss()
+
+        report = await self._report_repository.get_by_owner(owner_id)
+        if report is not None and client is not None:
+            settings = get_settings()
+            try:
+                await client.set(
+                    cache_key,
+                    report.model_dump_json(),
+                    ex=settings.cache_default_ttl_seconds or None,
+                )
+            except Exception:  # pragma: no cover - network failure scenarios
+                logger.warning("Failed to store cache key %s", cache_key, exc_info=True)
+            else:
+                cache_metrics.record_store()
+        return report
+
+    async def _load_counts_and_existing(
+        self, owner_id: int
+    ) -> tuple[dict[TaskStatus, int], TaskReport | None]:
+        """Fetch the status counts and the current report, overlapping where possible.
+
+        The two queries are independent, but one ``AsyncSession`` cannot run
+        them concurrently, so the value-only aggregate is dispatched on a
+        short-lived second session while the ORM read stays on the service
+        session. SQLite keeps the sequential path: its in-memory databases
+        are per-connection, so a second connection would not see the schema.
+        """
+
+        bind = self._session.bind
+        if bind is None or bind.dialect.name == "sqlite":
+            counts = await self._task_repository.count_by_status(owner_id=owner_id)
+            existing = await self._report_repository.get_by_owner(owner_id)
+            return counts, existing
+
+        async with AsyncSession(bind, expire_on_commit=False) as read_session:
+            counts, existing = await asyncio.gather(
+                TaskRepository(read_session).count_by_status(owner_id=owner_id),
+                self._report_repository.get_by_owner(owner_id),
+            )
+        return counts, existing
 
-        return await self._report_repository.get_by_owner(owner_id)
+    async def _lock_owner_report(self, owner_id: int) -> None:
+        """Serialise concurrent report refreshes for one owner.
+
+        A transaction-scoped Postgres advisory lock makes simultaneous
+        reporters queue instead of racing to the unique constraint and the
+        IntegrityError retry. Other backends skip the lock and rely on the
+        retry path.
+        """
+
+        bind = self._session.bind
+        if bind is None or bind.dialect.name != "postgresql":
+            return
+        await self._session.execute(_REPORT_LOCK_SQL, {"owner_id": owner_id})
 
     async def generate_report(self, owner_id: int) -> TaskReport:
         """Generate or refresh the aggregated task report for the owner."""
 
-        counts = await self._task_repository.count_by_status(owner_id=owner_id)
+        await self._lock_owner_report(owner_id)
+        counts, existing = await self._load_counts_and_existing(owner_id)
         summary = self._build_summary(owner_id, counts)
-        existing = await self._report_repository.get_by_owner(owner_id)
 
         if existing is None:
             report = TaskReport(
@@ -65,10 +146,12 @@ class TaskReportService:
         try:
             await self._session.commit()
         except IntegrityError:
-            logger.info("Detected concurrent report creation for owner %s; retrying as update.", owner_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Detected concurrent report creation for owner %s; retrying as update.", owner_id)
             await self._session.rollback()
             report = await self._retry_update(owner_id, summary)
         await self._report_repository.refresh(report)
+        await invalidate_report_cache(owner_id)
         return report
 
     def _apply_summary(self, report: TaskReport, summary: TaskReportSummary) -> None:
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from typing import Any
 
+from sqlalchemy import Row
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..core.cache import invalidate_task_cache
@@ -11,6 +14,11 @@ from ..models import Task, TaskStatus
 from ..repositories import TaskRepository, UserRepository
 
 
+# Zero-filled counter template built once; per-call statistics start from a
+# plain dict(...) copy instead of re-iterating the enum.
+_STATUS_ZERO_TEMPLATE: tuple[tuple[str, int], ...] = tuple((status.value, 0) for status in TaskStatus)
+
+
 @dataclass(slots=True)
 class TaskStatisticsResult:
     """Aggregate statistics for tasks, optionally scoped to an owner."""
@@ -33,24 +41,25 @@ class TaskService:
         """Expose the underlying repository for advanced scenarios."""
         return self._repository
 
-    async def _invalidate_cache(self) -> None:
-        await invalidate_task_cache()
+    async def _invalidate_cache(self, owner_id: int | None = None) -> None:
+        await invalidate_task_cache(owner_id)
 
-    def _apply_task_updates(
-        self,
-        task: Task,
+    @staticmethod
+    def _collect_updates(
         *,
         title: str | None = None,
         description: str | None = None,
         status: TaskStatus | None = None,
-    ) -> None:
-        """Apply in-memory changes to a task instance."""
+    ) -> dict[str, object]:
+        """Build the column/value mapping for an UPDATE from non-None fields."""
+        updates: dict[str, object] = {}
         if title is not None:
-            task.title = title
+            updates["title"] = title
         if description is not None:
-            task.description = description
+            updates["description"] = description
         if status is not None:
-            task.status = status
+            updates["status"] = status
+        return updates
 
     async def create_task(
         self,
@@ -60,20 +69,21 @@ class TaskService:
         description: str | None = None,
         status: TaskStatus = TaskStatus.PENDING,
     ) -> Task:
-        """Create a new task belonging to the specified owner."""
-        owner = await self._user_repository.get(owner_id)
-        if owner is None:
-            raise ValueError(f"Owner {owner_id} does not exist")
-        task = Task(
+        """Create a new task belonging to the specified owner.
+
+        The owner existence check rides along inside the INSERT ... SELECT,
+        so creation costs one statement plus the commit.
+        """
+        task = await self._repository.insert_for_owner(
             owner_id=owner_id,
             title=title,
             description=description,
             status=status,
         )
-        await self._repository.add(task)
+        if task is None:
+            raise ValueError(f"Owner {owner_id} does not exist")
         await self._session.commit()
-        await self._repository.refresh(task)
-        await self._invalidate_cache()
+        await self._invalidate_cache(owner_id)
         return task
 
     async def get_task(self, task_id: int) -> Task | None:
@@ -92,6 +102,14 @@ class TaskService:
         """Return all tasks assigned to a specific owner."""
         return await self._repository.list_for_owner(owner_id)
 
+    async def list_task_rows_for_owner(self, owner_id: int) -> Sequence[Row[Any]]:
+        """Return the owner's tasks as lightweight Core rows for read-only rendering."""
+        return await self._repository.list_rows_for_owner(owner_id)
+
+    def stream_tasks_for_owner(self, owner_id: int) -> AsyncIterator[Task]:
+        """Stream an owner's tasks in batches; intended for exports over large sets."""
+        return self._repository.stream_for_owner(owner_id)
+
     async def list_tasks_by_status(self, status: TaskStatus) -> list[Task]:
         """Return tasks filtered by their status."""
         return await self._repository.list_by_status(status)
@@ -103,22 +121,25 @@ class TaskService:
         status: TaskStatus | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[Task], int]:
+        after_id: int | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Task], int | None]:
         """Return tasks matching the provided filters and pagination options."""
         return await self._repository.list_paginated(
             owner_id=owner_id,
             status=status,
             limit=limit,
             offset=offset,
+            after_id=after_id,
+            include_total=include_total,
         )
 
     async def get_task_statistics(self, owner_id: int | None = None) -> TaskStatisticsResult:
         """Return aggregate statistics for tasks, optionally filtered by owner."""
 
         counts = await self._repository.count_by_status(owner_id=owner_id)
-        by_status = {status.value: 0 for status in TaskStatus}
-        for status, count in counts.items():
-            by_status[status.value] = count
+        by_status = dict(_STATUS_ZERO_TEMPLATE)
+        by_status.update((status.value, count) for status, count in counts.items())
         total = sum(by_status.values())
         return TaskStatisticsResult(owner_id=owner_id, total=total, by_status=by_status)
 
@@ -130,19 +151,22 @@ class TaskService:
         description: str | None = None,
         status: TaskStatus | None = None,
     ) -> Task:
-        """Apply updates to a task and persist the changes."""
-        task = await self._repository.get(task_id)
+        """Apply updates to a task and persist the changes.
+
+        A single ``UPDATE ... RETURNING`` replaces the previous SELECT,
+        UPDATE and refresh round trips.
+        """
+        updates = self._collect_updates(title=title, description=description, status=status)
+        if not updates:
+            task = await self._repository.get(task_id)
+            if task is None:
+                raise ValueError(f"Task {task_id} does not exist")
+            return task
+        task = await self._repository.update_returning(task_id, updates)
         if task is None:
             raise ValueError(f"Task {task_id} does not exist")
-        self._apply_task_updates(
-            task,
-            title=title,
-            description=description,
-            status=status,
-        )
         await self._session.commit()
-        await self._repository.refresh(task)
-        await self._invalidate_cache()
+        await self._invalidate_cache(task.owner_id)
         return task
 
     async def update_task_for_owner(
@@ -154,35 +178,43 @@ class TaskService:
         description: str | None = None,
         status: TaskStatus | None = None,
     ) -> Task:
-        """Update a task while ensuring it belongs to the specified owner."""
-        task = await self._repository.get(task_id)
+        """Update a task while ensuring it belongs to the specified owner.
+
+        Ownership is enforced as a WHERE predicate on the UPDATE itself; the
+        extra lookup only happens on the miss path to distinguish a missing
+        task from one owned by somebody else.
+        """
+        updates = self._collect_updates(title=title, description=description, status=status)
+        if not updates:
+            task = await self._repository.get_for_owner(task_id, owner_id)
+            if task is None:
+                if await self._repository.exists(task_id):
+                    raise PermissionError("Task does not belong to the specified owner")
+                raise ValueError(f"Task {task_id} does not exist")
+            return task
+        task = await self._repository.update_returning(task_id, updates, owner_id=owner_id)
         if task is None:
+            if await self._repository.exists(task_id):
+                raise PermissionError("Task does not belong to the specified owner")
             raise ValueError(f"Task {task_id} does not exist")
-        if task.owner_id != owner_id:
-            raise PermissionError("Task does not belong to the specified owner")
-        self._apply_task_updates(
-            task,
-            title=title,
-            description=description,
-            status=status,
-        )
         await self._session.commit()
-        await self._repository.refresh(task)
-        await self._invalidate_cache()
+        await self._invalidate_cache(owner_id)
         return task
 
     async def reassign_task(self, task_id: int, owner_id: int) -> Task:
         """Transfer a task to a different owner."""
-        task = await self._repository.get(task_id)
-        if task is None:
-            raise ValueError(f"Task {task_id} does not exist")
         owner = await self._user_repository.get(owner_id)
         if owner is None:
             raise ValueError(f"Owner {owner_id} does not exist")
-        task.owner_id = owner_id
+        previous_owner_id = await self._repository.get_owner_id(task_id)
+        task = await self._repository.update_returning(task_id, {"owner_id": owner_id})
+        if task is None:
+            raise ValueError(f"Task {task_id} does not exist")
         await self._session.commit()
-        await self._repository.refresh(task)
-        await self._invalidate_cache()
+        # Both sides of the transfer have stale cached lists.
+        if previous_owner_id is not None and previous_owner_id != owner_id:
+            await self._invalidate_cache(previous_owner_id)
+        await self._invalidate_cache(owner_id)
         return task
 
     async def delete_task(self, task_id: int) -> bool:
@@ -192,17 +224,17 @@ class TaskService:
             return False
         await self._repository.delete(task)
         await self._session.commit()
-        await self._invalidate_cache()
+        await self._invalidate_cache(task.owner_id)
         return True
 
     async def delete_task_for_owner(self, task_id: int, owner_id: int) -> bool:
         """Delete a task while ensuring it belongs to the provided owner."""
-        task = await self._repository.get(task_id)
+        task = await self._repository.get_for_owner(task_id, owner_id)
         if task is None:
+            if await self._repository.exists(task_id):
+                raise PermissionError("Task does not belong to the specified owner")
             return False
-        if task.owner_id != owner_id:
-            raise PermissionError("Task does not belong to the specified owner")
         await self._repository.delete(task)
         await self._session.commit()
-        await self._invalidate_cache()
+        await self._invalidate_cache(owner_id)
         return True
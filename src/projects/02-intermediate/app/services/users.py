@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Sequence
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -33,7 +35,11 @@ class UserService:
         role: UserRole = UserRole.USER,
     ) -> User:
         """Create and persist a new user record."""
-        hashed_password = get_password_hash(password)
+        # bcrypt is deliberately slow; run it on a worker thread so the
+        # event loop keeps serving other requests during the hash.
+        hashed_password = await asyncio.get_running_loop().run_in_executor(
+            None, get_password_hash, password
+        )
         user = User(
             email=email,
             full_name=full_name,
@@ -43,7 +49,6 @@ class UserService:
         )
         await self._repository.add(user)
         await self._session.commit()
-        await self._repository.refresh(user)
         return user
 
     async def get_user(self, user_id: int) -> User | None:
@@ -58,6 +63,10 @@ class UserService:
         """Return all registered users."""
         return await self._repository.list()
 
+    def stream_users(self) -> AsyncIterator[User]:
+        """Stream all users in batches; intended for exports over large sets."""
+        return self._repository.stream()
+
     async def list_active_users(self) -> list[User]:
         """Return all users flagged as active."""
         return await self._repository.list_active()
@@ -66,6 +75,10 @@ class UserService:
         """Retrieve users whose identifiers match the provided sequence."""
         return await self._repository.list_by_ids(ids)
 
+    async def list_ids_to_emails(self, ids: Sequence[int]) -> dict[int, str]:
+        """Resolve user ids to emails in one query for bulk display purposes."""
+        return await self._repository.list_ids_to_emails(ids)
+
     async def update_user(
         self,
         user_id: int,
@@ -86,9 +99,10 @@ class UserService:
         if role is not None:
             user.role = role
         if password is not None:
-            user.hashed_password = get_password_hash(password)
+            user.hashed_password = await asyncio.get_running_loop().run_in_executor(
+                None, get_password_hash, password
+            )
         await self._session.commit()
-        await self._repository.refresh(user)
         return user
 
     async def delete_user(self, user_id: int) -> bool:
@@ -58,4 +58,5 @@ async def activity_feed(
             "events": events,
             "limit": limit,
         },
+        needs_csrf=False,
     )
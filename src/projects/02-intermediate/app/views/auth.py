@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from fastapi import APIRouter, Request, status
 from starlette.datastructures import FormData
 from starlette.responses import RedirectResponse
@@ -8,33 +10,41 @@ from ..core.session import add_flash_message, login_user, logout_user, validate_
 from ..core.templates import template_response
 from ..deps import (
     ActivityServiceDependency,
+    AuthServiceDependency,
     AuthenticatedSessionUserDependency,
-    DatabaseSessionDependency,
     SessionUserDependency,
-    SettingsDependency,
+    ValidatedFormDependency,
 )
 from ..errors import ApplicationError
-from ..services import AuthService
 
 router = APIRouter(tags=["auth"])
 
 
 def _clean_email(raw: object) -> str:
-    return str(raw or "").strip().lower()
+    if not isinstance(raw, str):
+        raw = str(raw or "")
+    return raw.strip().lower()
 
 
 def _clean_text(raw: object) -> str:
-    return str(raw or "").strip()
+    if not isinstance(raw, str):
+        raw = str(raw or "")
+    return raw.strip()
+
+
+@dataclass(slots=True)
+class _FormPayload:
+    """Slotted re-render payload for the auth templates (never the password)."""
 
+    email: str = ""
+    full_name: str = ""
 
-def _form_payload(form: FormData, *, include_password: bool = False) -> dict[str, str]:
-    payload = {
-        "email": _clean_email(form.get("email")),
-        "full_name": _clean_text(form.get("full_name")),
-    }
-    if include_password:
-        payload["password"] = _clean_text(form.get("password"))
-    return payload
+
+def _form_payload(form: FormData) -> _FormPayload:
+    return _FormPayload(
+        email=_clean_email(form.get("email")),
+        full_name=_clean_text(form.get("full_name")),
+    )
 
 
 def _csrf_invalid_response(request: Request, context: dict[str, object], *, template: str) -> object:
@@ -53,7 +63,7 @@ async def login_form(request: Request, current_user: SessionUserDependency) -> o
         "auth/login.html",
         {
             "title": "Sign in",
-            "form": {"email": ""},
+            "form": _FormPayload(),
             "errors": {},
         },
     )
@@ -62,15 +72,15 @@ async def login_form(request: Request, current_user: SessionUserDependency) -> o
 @router.post("/login", name="auth:login:submit")
 async def login_submit(
     request: Request,
-    session: DatabaseSessionDependency,
-    settings: SettingsDependency,
+    validated_form: ValidatedFormDependency,
+    auth_service: AuthServiceDependency,
     activity_service: ActivityServiceDependency,
 ) -> object:
     """Handle login form submissions."""
 
-    form = await request.form()
-    if not validate_csrf_token(request.session, form.get("csrf_token")):
-        context = {"form": _form_payload(form, include_password=False), "errors": {}}
+    form = validated_form.form
+    if not validated_form.csrf_ok:
+        context = {"form": _form_payload(form), "errors": {}}
         return _csrf_invalid_response(request, context, template="auth/login.html")
 
     email = _clean_email(form.get("email"))
@@ -82,7 +92,6 @@ async def login_submit(
     if not password:
         errors["password"] = "Password is required."
 
-    auth_service = AuthService(session, settings)
     user = None
     if not errors:
         try:
@@ -99,7 +108,7 @@ async def login_submit(
             "auth/login.html",
             {
                 "title": "Sign in",
-                "form": {"email": email},
+                "form": _FormPayload(email=email),
                 "errors": errors,
             },
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -112,7 +121,7 @@ async def login_submit(
             "auth/login.html",
             {
                 "title": "Sign in",
-                "form": {"email": email},
+                "form": _FormPayload(email=email),
                 "errors": errors,
             },
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -135,7 +144,7 @@ async def register_form(request: Request, current_user: SessionUserDependency) -
         "auth/register.html",
         {
             "title": "Create an account",
-            "form": {"email": "", "full_name": ""},
+            "form": _FormPayload(),
             "errors": {},
         },
     )
@@ -144,13 +153,13 @@ async def register_form(request: Request, current_user: SessionUserDependency) -
 @router.post("/register", name="auth:register:submit")
 async def register_submit(
     request: Request,
-    session: DatabaseSessionDependency,
-    settings: SettingsDependency,
+    validated_form: ValidatedFormDependency,
+    auth_service: AuthServiceDependency,
 ) -> object:
     """Handle registration form submissions."""
 
-    form = await request.form()
-    if not validate_csrf_token(request.session, form.get("csrf_token")):
+    form = validated_form.form
+    if not validated_form.csrf_ok:
         context = {"form": _form_payload(form), "errors": {}}
         return _csrf_invalid_response(request, context, template="auth/register.html")
 
@@ -164,7 +173,6 @@ async def register_submit(
     if not password or len(password) < 8:
         errors["password"] = "Password must be at least 8 characters."
 
-    auth_service = AuthService(session, settings)
     user = None
     if not errors:
         try:
@@ -178,7 +186,7 @@ async def register_submit(
             "auth/register.html",
             {
                 "title": "Create an account",
-                "form": {"email": email, "full_name": full_name},
+                "form": _FormPayload(email=email, full_name=full_name),
                 "errors": errors,
             },
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -191,7 +199,7 @@ async def register_submit(
             "auth/register.html",
             {
                 "title": "Create an account",
-                "form": {"email": email, "full_name": full_name},
+                "form": _FormPayload(email=email, full_name=full_name),
                 "errors": errors,
             },
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -5,9 +5,13 @@ from starlette.responses import RedirectResponse
 
 from ..core.session import add_flash_message, validate_csrf_token
 from ..core.templates import is_htmx_request, partial_response, template_response
-from ..deps import ActivityServiceDependency, AuthenticatedSessionUserDependency, DatabaseSessionDependency
+from ..deps import (
+    ActivityServiceDependency,
+    AuthenticatedSessionUserDependency,
+    TaskServiceDependency,
+    ValidatedFormDependency,
+)
 from ..models import TaskStatus
-from ..services import TaskService
 
 router = APIRouter(tags=["notes"])
 
@@ -33,21 +37,21 @@ def _redirect_to_notes(request: Request) -> RedirectResponse:
 async def list_notes(
     request: Request,
     current_user: AuthenticatedSessionUserDependency,
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
 ) -> object:
     """Render the authenticated user's collection of notes/tasks."""
 
-    service = TaskService(session)
     user_id = _require_user_id(current_user)
-    tasks = await service.list_tasks_for_owner(user_id)
+    tasks = await service.list_task_rows_for_owner(user_id)
+    draft = request.session.pop("note_draft", None)
     return template_response(
         request,
         "notes/index.html",
         {
             "title": "My entries",
             "tasks": tasks,
-            "form": {"title": "", "description": ""},
-            "errors": {},
+            "form": draft or {"title": "", "description": ""},
+            "errors": {"title": "Title is required."} if draft is not None else {},
             "current_user": current_user,
         },
     )
@@ -57,39 +61,27 @@ async def list_notes(
 async def create_note(
     request: Request,
     current_user: AuthenticatedSessionUserDependency,
-    session: DatabaseSessionDependency,
+    validated_form: ValidatedFormDependency,
+    service: TaskServiceDependency,
     activity_service: ActivityServiceDependency,
 ) -> object:
     """Persist a new note for the authenticated user."""
 
-    form = await request.form()
-    if not validate_csrf_token(request.session, form.get("csrf_token")):
+    form = validated_form.form
+    if not validated_form.csrf_ok:
         add_flash_message(request.session, "error", "The form has expired. Please try again.")
         return _redirect_to_notes(request)
 
     title = _clean_text(form.get("title"))
     description = _clean_text(form.get("description"))
 
-    errors: dict[str, str] = {}
-    if not title:
-        errors["title"] = "Title is required."
-
-    service = TaskService(session)
     user_id = _require_user_id(current_user)
-    if errors:
-        tasks = await service.list_tasks_for_owner(user_id)
-        return template_response(
-            request,
-            "notes/index.html",
-            {
-                "title": "My entries",
-                "tasks": tasks,
-                "form": {"title": title, "description": description},
-                "errors": errors,
-                "current_user": current_user,
-            },
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
+    if not title:
+        # Redirect back instead of re-rendering, so the validation failure
+        # does not pay for a second task-list query (POST/Redirect/GET).
+        add_flash_message(request.session, "error", "Title is required.")
+        request.session["note_draft"] = {"title": title, "description": description}
+        return _redirect_to_notes(request)
 
     task = await service.create_task(
         owner_id=user_id,
@@ -107,7 +99,7 @@ async def toggle_status(
     task_id: int,
     request: Request,
     current_user: AuthenticatedSessionUserDependency,
-    session: DatabaseSessionDependency,
+    service: TaskServiceDependency,
     activity_service: ActivityServiceDependency,
 ) -> object:
     """Toggle a note between pending and completed states."""
@@ -116,13 +108,29 @@ async def toggle_status(
     if not validate_csrf_token(request.session, form.get("csrf_token")):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid CSRF token.")
 
-    service = TaskService(session)
     user_id = _require_user_id(current_user)
     task = await service.get_task_for_owner(task_id, user_id)
     if task is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found.")
 
-    new_status = TaskStatus.COMPLETED if task.status != TaskStatus.COMPLETED else TaskStatus.PENDING
+    try:
+        target_status = TaskStatus(str(form.get("target_status")))
+    except ValueError:
+        target_status = None
+    new_status = target_status or (
+        TaskStatus.COMPLETED if task.status != TaskStatus.COMPLETED else TaskStatus.PENDING
+    )
+    if task.status == new_status:
+        # Double-click or HTMX retry: the task is already in the requested
+        # state, so skip the UPDATE/commit/invalidation round trips.
+        if is_htmx_request(request):
+            return partial_response(
+                request,
+                "notes/_note_item.html",
+                {"task": task, "current_user": current_user},
+            )
+        return _redirect_to_notes(request)
+
     task = await service.update_task_for_owner(
         task_id,
         user_id,
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 
-from rq import Connection, Worker
+from redis.exceptions import RedisError
+from rq import Connection, Queue, Worker
+from rq.job import Job
+from rq.utils import as_text
 
 from .core.config import get_settings
 from .core.jobs import get_job_connection, get_job_queue
@@ -12,6 +16,53 @@ from .core.logging import configure_logging
 
 logger = logging.getLogger("projects.02-intermediate.app.worker")
 
+# Jobs pulled per Redis round-trip when draining a backlog.
+PREFETCH_BATCH_SIZE = 16
+
+
+class PrefetchingWorker(Worker):
+    """RQ worker that prefetches a batch of job ids per Redis round-trip.
+
+    ``Worker.work`` issues one blocking pop per executed job; for the
+    short report jobs here the poll/reply gap dominates runtime. After a
+    blocking dequeue lands, this worker opportunistically drains up to
+    ``PREFETCH_BATCH_SIZE - 1`` further job ids with a single
+    non-blocking ``LPOP count`` plus one ``fetch_many``, then executes
+    them in order from an in-memory deque. Jobs execute through the
+    normal ``execute_job`` path, so retry and failure handling are
+    unchanged; the batch is kept small to bound the at-risk window if
+    the worker dies with jobs buffered.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self._prefetched: deque[tuple[Job, Queue]] = deque()
+
+    def dequeue_job_and_maintain_ttl(
+        self, timeout: int | None, max_idle_time: int | None = None
+    ) -> tuple[Job, Queue] | None:
+        if self._prefetched:
+            return self._prefetched.popleft()
+        result = super().dequeue_job_and_maintain_ttl(timeout, max_idle_time)
+        if result is not None:
+            self._fill_prefetch_buffer(result[1])
+        return result
+
+    def _fill_prefetch_buffer(self, queue: Queue) -> None:
+        try:
+            # LPOP with a count (Redis >= 6.2) pops the ids in queue order
+            # in one round-trip; older servers raise and fall back to the
+            # per-job blocking path.
+            raw_ids = queue.connection.lpop(queue.key, PREFETCH_BATCH_SIZE - 1)
+        except RedisError:
+            logger.debug("Batch job prefetch unavailable; using per-job dequeue.", exc_info=True)
+            return
+        if not raw_ids:
+            return
+        job_ids = [as_text(raw_id) for raw_id in raw_ids]
+        jobs = Job.fetch_many(job_ids, connection=queue.connection, serializer=queue.serializer)
+        self._prefetched.extend((job, queue) for job in jobs if job is not None)
+
 
 def run() -> None:
     """Start an RQ worker bound to the configured queue."""
@@ -31,7 +82,7 @@ def run() -> None:
         extra={"queue": queue.name, "worker_name": worker_name or "anonymous"},
     )
     with Connection(connection):
-        worker = Worker([queue], name=worker_name)
+        worker = PrefetchingWorker([queue], name=worker_name)
         worker.work(with_scheduler=True)
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hmac
 from typing import Mapping
 
 from fastapi import HTTPException, Request, status
@@ -19,22 +20,46 @@ class RealtimeAuthenticationError(RuntimeError):
 def _extract_authorization_token(headers: Mapping[str, str]) -> str | None:
     """Pull a bearer token out of the provided header mapping."""
 
-    auth = headers.get("authorization") or headers.get("Authorization")
+    # Starlette header mappings are case-insensitive, so one lookup suffices.
+    auth = headers.get("authorization")
     if not auth:
         return None
+    # Nearly every client sends exactly "Bearer <token>"; a prefix slice
+    # skips the partition and case-fold allocations on that path.
+    if auth[:7] in ("Bearer ", "bearer "):
+        return auth[7:].strip() or None
     scheme, _, token = auth.partition(" ")
     if scheme.lower() != "bearer" or not token:
         return None
     return token.strip()
 
 
+def _token_matches(token: str, settings: Settings) -> bool:
+    """Constant-time comparison against the pre-encoded realtime token."""
+
+    return hmac.compare_digest(token.encode("utf-8"), settings.hot.realtime_token_bytes)
+
+
+def _query_token(connection: Request | WebSocket) -> str | None:
+    """Read ``token`` from the query string, parsing it only when present.
+
+    ``query_params`` lazily builds a multidict on first access; probing the
+    raw ASGI query string first keeps header-authenticated requests from
+    paying for that parse.
+    """
+
+    if b"token=" not in connection.scope.get("query_string", b""):
+        return None
+    return connection.query_params.get("token")
+
+
 def require_http_token(request: Request, settings: Settings) -> str:
     """Validate the realtime token for HTTP endpoints such as SSE."""
 
-    token = request.query_params.get("token")
+    token = _query_token(request)
     if not token:
         token = _extract_authorization_token(request.headers)
-    if not token or token != settings.realtime_token:
+    if not token or not _token_matches(token, settings):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing realtime token.",
@@ -45,10 +70,10 @@ def require_http_token(request: Request, settings: Settings) -> str:
 async def authenticate_websocket(websocket: WebSocket, settings: Settings) -> str:
     """Authenticate an incoming websocket connection by inspecting query and headers."""
 
-    token = websocket.query_params.get("token")
+    token = _query_token(websocket)
     if not token:
         token = _extract_authorization_token(websocket.headers)
-    if not token or token != settings.realtime_token:
+    if not token or not _token_matches(token, settings):
         await websocket.close(code=UNAUTHORIZED_CLOSE_CODE)
         raise RealtimeAuthenticationError("Invalid realtime token.")
     return token
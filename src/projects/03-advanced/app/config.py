@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Annotated, Any, Callable, Literal
 
 from fastapi import Depends
@@ -10,6 +11,22 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@dataclass(frozen=True, slots=True)
+class HotSettings:
+    """Frozen snapshot of the fields hot paths read per request or frame.
+
+    Slot access is a single offset load, versus the model ``__dict__`` and
+    descriptor indirection Pydantic pays per attribute; token auth and the
+    SSE loop read from this snapshot instead of the full ``Settings``.
+    """
+
+    realtime_token_bytes: bytes
+    sse_heartbeat_seconds: float
+    board_channel: str
+    activity_channel: str
+    websocket_max_connections: int
+
+
 class Settings(BaseSettings):
     """Runtime configuration for the advanced realtime layer."""
 
@@ -115,14 +132,75 @@ class Settings(BaseSettings):
     x_frame_options: str = "DENY"
     remove_server_header: bool = True
 
+    @cached_property
+    def hot(self) -> HotSettings:
+        """Slotted snapshot of the per-request fields, built once per instance."""
+
+        return HotSettings(
+            realtime_token_bytes=self.realtime_token.encode("utf-8"),
+            sse_heartbeat_seconds=float(self.sse_heartbeat_seconds),
+            board_channel=self.board_channel,
+            activity_channel=self.activity_channel,
+            websocket_max_connections=self.websocket_max_connections,
+        )
+
+    @cached_property
+    def allowed_origins_frozen(self) -> frozenset[str]:
+        """Origins as a frozenset so CORS membership checks are O(1)."""
+
+        return frozenset(self.allowed_origins)
+
+    @cached_property
+    def cors_allow_methods_tuple(self) -> tuple[str, ...]:
+        return tuple(self.cors_allow_methods)
+
+    @cached_property
+    def cors_allow_headers_tuple(self) -> tuple[str, ...]:
+        return tuple(self.cors_allow_headers)
+
+    @cached_property
+    def cors_expose_headers_tuple(self) -> tuple[str, ...]:
+        return tuple(self.cors_expose_headers)
+
+    @cached_property
+    def security_headers(self) -> dict[str, str]:
+        """Filtered security-header map, built once per settings instance."""
+
+        headers = {
+            header: value
+            for header, value in {
+                "Strict-Transport-Security": self.strict_transport_security,
+                "X-Content-Type-Options": self.x_content_type_options,
+                "X-Frame-Options": self.x_frame_options,
+                "Referrer-Policy": self.referrer_policy,
+                "Permissions-Policy": self.permissions_policy,
+                "Cross-Origin-Opener-Policy": self.cross_origin_opener_policy,
+                "Cross-Origin-Resource-Policy": self.cross_origin_resource_policy,
+            }.items()
+            if value
+        }
+        if self.cross_origin_embedder_policy:
+            headers["Cross-Origin-Embedder-Policy"] = self.cross_origin_embedder_policy
+        if self.content_security_policy:
+            headers["Content-Security-Policy"] = self.content_security_policy
+        return headers
+
     @staticmethod
+    @lru_cache(maxsize=64)
+    def _split_csv(value: str) -> tuple[str, ...]:
+        """Split a comma-separated string, cached for repeated construction."""
+
+        return tuple(item.strip() for item in value.split(",") if item.strip())
+
+    @classmethod
     def _coerce_list(
+        cls,
         value: str | list[str] | tuple[str, ...],
         *,
         normalise: Callable[[str], str] | None = None,
     ) -> list[str]:
         if isinstance(value, str):
-            items = [item.strip() for item in value.split(",") if item.strip()]
+            items = list(cls._split_csv(value))
         elif isinstance(value, (list, tuple)):
             items = [str(item).strip() for item in value if str(item).strip()]
         else:
@@ -149,12 +227,23 @@ class Settings(BaseSettings):
     @classmethod
     def _parse_cors_methods(cls, value: str | list[str]) -> list[str]:
         methods = cls._coerce_list(value, normalise=lambda entry: entry.upper())
+        if "*" in methods:
+            raise ValueError(
+                "Wildcard methods are not supported for ADVANCED_CORS_ALLOW_METHODS;"
+                " enumerate the methods explicitly."
+            )
         return methods or ["GET", "HEAD", "OPTIONS"]
 
     @field_validator("cors_allow_headers", "cors_expose_headers", mode="before")
     @classmethod
     def _parse_cors_headers(cls, value: str | list[str]) -> list[str]:
-        return cls._coerce_list(value)
+        headers = cls._coerce_list(value)
+        if "*" in headers:
+            raise ValueError(
+                "Wildcard headers are not supported for the CORS header lists;"
+                " enumerate the headers explicitly."
+            )
+        return headers
 
     @field_validator("cors_max_age")
     @classmethod
@@ -221,4 +310,14 @@ def get_settings() -> Settings:
     return Settings()  # type: ignore[arg-type]
 
 
+def get_hot_settings() -> HotSettings:
+    """Return the hot-path snapshot of the cached settings.
+
+    Derives from :func:`get_settings` rather than caching separately, so
+    tests that call ``get_settings.cache_clear()`` stay consistent.
+    """
+
+    return get_settings().hot
+
+
 SettingsDependency = Annotated[Settings, Depends(get_settings)]
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from pathlib import Path
 from typing import Annotated, AsyncIterator
 
 from fastapi import Depends, FastAPI, Request, WebSocket, WebSocketDisconnect, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from starlette.types import Receive, Scope, Send
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
@@ -28,7 +27,7 @@ from .realtime import (
     ActivityEvent,
     broker,
 )
-from .security import SecurityHeadersMiddleware
+from .security import CombinedSecurityCORSMiddleware
 from .telemetry import ObservabilityMiddleware, configure_telemetry, record_rate_limit_rejection
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -37,6 +36,70 @@ TEMPLATE_DIR = BASE_DIR / "templates"
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded SSE heartbeat frame; yielding bytes also skips the
+# StreamingResponse str->bytes encode step per frame.
+HEARTBEAT_FRAME = b"event: heartbeat\ndata: {}\n\n"
+
+
+# Raw header list for the SSE response start message, encoded once.
+_SSE_RAW_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+    (b"cache-control", b"no-store"),
+    (b"connection", b"keep-alive"),
+    (b"x-accel-buffering", b"no"),
+)
+
+
+class SSEResponse(Response):
+    """Minimal ASGI response for server-sent event streams.
+
+    Sends a precomputed ``http.response.start`` message and forwards the
+    generator's already-encoded byte frames verbatim, skipping the
+    per-chunk encode check and background-task handling that
+    ``StreamingResponse`` performs for arbitrary iterables.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content: AsyncIterator[bytes]) -> None:
+        self.body_iterator = content
+        self.status_code = 200
+        self.background = None
+        # Middleware (e.g. CORS) appends to the header list in place, so
+        # each response needs its own copy of the template.
+        self.raw_headers = list(_SSE_RAW_HEADERS)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        async for chunk in self.body_iterator:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def _watch_disconnect(request: Request) -> None:
+    """Complete once the client's ``http.disconnect`` message arrives."""
+
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def validate_http_token(request: Request, settings: SettingsDependency) -> str:
+    """Dependency wrapper around :func:`require_http_token`.
+
+    Lives at module scope so FastAPI analyses its signature once at import
+    instead of once per ``create_app`` call.
+    """
+
+    return require_http_token(request, settings)
+
 
 def create_app() -> FastAPI:
     """Instantiate and configure the FastAPI application for realtime collaboration."""
@@ -90,46 +153,14 @@ def create_app() -> FastAPI:
 
     app.add_exception_handler(RateLimitExceeded, _rate_limit_handler)
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.allowed_origins,
-        allow_credentials=settings.cors_allow_credentials,
-        allow_methods=settings.cors_allow_methods,
-        allow_headers=settings.cors_allow_headers,
-        expose_headers=settings.cors_expose_headers,
-        max_age=settings.cors_max_age,
-    )
+    # One ASGI layer covers both CORS and security headers, so requests
+    # walk one middleware frame here instead of two.
+    app.add_middleware(CombinedSecurityCORSMiddleware, settings=settings)
 
-    if settings.security_headers_enabled:
-        security_headers = {
-            header: value
-            for header, value in {
-                "Strict-Transport-Security": settings.strict_transport_security,
-                "X-Content-Type-Options": settings.x_content_type_options,
-                "X-Frame-Options": settings.x_frame_options,
-                "Referrer-Policy": settings.referrer_policy,
-                "Permissions-Policy": settings.permissions_policy,
-                "Cross-Origin-Opener-Policy": settings.cross_origin_opener_policy,
-                "Cross-Origin-Resource-Policy": settings.cross_origin_resource_policy,
-            }.items()
-            if value
-        }
-        if settings.cross_origin_embedder_policy:
-            security_headers["Cross-Origin-Embedder-Policy"] = (
-                settings.cross_origin_embedder_policy
-            )
-        if settings.content_security_policy:
-            security_headers["Content-Security-Policy"] = (
-                settings.content_security_policy
-            )
-        if security_headers:
-            app.add_middleware(
-                SecurityHeadersMiddleware,
-                headers=security_headers,
-                remove_server_header=settings.remove_server_header,
-            )
-
-    app.add_middleware(SlowAPIMiddleware)
+    # With no default and no per-route limit there is nothing for the
+    # middleware to enforce, so skip its per-request frame entirely.
+    if default_limits or settings.activity_stream_rate_limit:
+        app.add_middleware(SlowAPIMiddleware)
     if telemetry_state.enabled:
         app.add_middleware(ObservabilityMiddleware, telemetry=telemetry_state)
 
@@ -138,34 +169,33 @@ def create_app() -> FastAPI:
 
     templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
-    async def validate_http_token(
-        request: Request, settings: SettingsDependency
-    ) -> str:
-        return require_http_token(request, settings)
+    # Everything the index interpolates comes from settings, so the page
+    # is constant for the app's lifetime: render it once here and serve
+    # the cached bytes instead of walking the template per request.
+    token_hint = (
+        settings.realtime_token
+        if settings.realtime_token.startswith("change-me")
+        else "Configured via ADVANCED_REALTIME_TOKEN"
+    )
+    index_html = templates.get_template("index.html").render(
+        project_name=settings.project_name,
+        token_hint=token_hint,
+        channels={
+            "board": settings.board_channel,
+            "activity": settings.activity_channel,
+        },
+        reconnect={
+            "initial_delay": settings.reconnect_initial_delay_seconds,
+            "max_delay": settings.reconnect_max_delay_seconds,
+        },
+        url_for=app.url_path_for,
+    ).encode("utf-8")
 
     @app.get("/", response_class=HTMLResponse)
-    async def index(request: Request, settings: SettingsDependency) -> HTMLResponse:
+    async def index() -> HTMLResponse:
         """Serve the realtime playground surface."""
 
-        token_hint = (
-            settings.realtime_token
-            if settings.realtime_token.startswith("change-me")
-            else "Configured via ADVANCED_REALTIME_TOKEN"
-        )
-        context = {
-            "request": request,
-            "project_name": settings.project_name,
-            "token_hint": token_hint,
-            "channels": {
-                "board": settings.board_channel,
-                "activity": settings.activity_channel,
-            },
-            "reconnect": {
-                "initial_delay": settings.reconnect_initial_delay_seconds,
-                "max_delay": settings.reconnect_max_delay_seconds,
-            },
-        }
-        return templates.TemplateResponse("index.html", context)
+        return HTMLResponse(index_html)
 
     @app.get(settings.metrics_path, include_in_schema=False)
     @limiter.exempt
@@ -196,33 +226,60 @@ def create_app() -> FastAPI:
         request: Request,
         _: Annotated[str, Depends(validate_http_token)],
         settings: SettingsDependency,
-    ) -> StreamingResponse:
+    ) -> SSEResponse:
         """Stream board activity events via Server-Sent Events."""
 
         queue = await broker.register_activity_listener()
 
-        async def event_source() -> AsyncIterator[str]:
+        async def event_source() -> AsyncIterator[bytes]:
+            # One TimerHandle per heartbeat interval instead of the
+            # asyncio.wait_for Task + timer + cancel scope per message.
+            loop = asyncio.get_running_loop()
+            interval = settings.hot.sse_heartbeat_seconds
+            heartbeat_event = asyncio.Event()
+            heartbeat_handle = loop.call_later(interval, heartbeat_event.set)
+            # One long-lived receive() listener replaces the
+            # is_disconnected() poll (and its shielded receive round
+            # trip) that used to run before every frame.
+            disconnect_task = asyncio.ensure_future(_watch_disconnect(request))
+            get_task: asyncio.Task[ActivityEvent] | None = None
+            heartbeat_task: asyncio.Task[bool] | None = None
             try:
                 while True:
-                    if await request.is_disconnected():
+                    if get_task is None:
+                        get_task = asyncio.ensure_future(queue.get())
+                    if heartbeat_task is None:
+                        heartbeat_task = asyncio.ensure_future(heartbeat_event.wait())
+                    done, _ = await asyncio.wait(
+                        {get_task, heartbeat_task, disconnect_task},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if disconnect_task in done:
                         break
-                    try:
-                        event: ActivityEvent = await asyncio.wait_for(
-                            queue.get(), timeout=settings.sse_heartbeat_seconds
+                    if heartbeat_task in done:
+                        heartbeat_task = None
+                        heartbeat_event.clear()
+                        heartbeat_handle = loop.call_later(interval, heartbeat_event.set)
+                        yield HEARTBEAT_FRAME
+                    if get_task in done:
+                        event: ActivityEvent = get_task.result()
+                        get_task = None
+                        payload = event.model_dump_json()
+                        yield b"id: %b\nevent: %b\ndata: %b\n\n" % (
+                            event.id.encode(),
+                            event.action.encode(),
+                            payload.encode(),
                         )
-                    except asyncio.TimeoutError:
-                        yield "event: heartbeat\ndata: {}\n\n"
-                        continue
-                    payload = json.dumps(event.model_dump())
-                    yield f"id: {event.id}\nevent: {event.action}\ndata: {payload}\n\n"
             finally:
+                heartbeat_handle.cancel()
+                disconnect_task.cancel()
+                if get_task is not None:
+                    get_task.cancel()
+                if heartbeat_task is not None:
+                    heartbeat_task.cancel()
                 await broker.unregister_activity_listener(queue)
 
-        response = StreamingResponse(event_source(), media_type="text/event-stream")
-        response.headers["Cache-Control"] = "no-store"
-        response.headers["Connection"] = "keep-alive"
-        response.headers["X-Accel-Buffering"] = "no"
-        return response
+        return SSEResponse(event_source())
 
     @app.websocket("/ws/boards/{board_id}")
     async def board_updates(websocket: WebSocket, board_id: str, settings: SettingsDependency) -> None:
@@ -244,20 +301,11 @@ def create_app() -> FastAPI:
 
         try:
             while True:
+                raw = await websocket.receive_text()
                 try:
-                    raw = await websocket.receive_json()
-                except json.JSONDecodeError:
-                    await websocket.send_json(
-                        {
-                            "kind": "error",
-                            "reason": "invalid_json",
-                            "detail": "Messages must be valid JSON objects.",
-                        }
-                    )
-                    continue
-
-                try:
-                    message = BoardMessage.model_validate(raw)
+                    # Validates straight from the JSON text, skipping the
+                    # intermediate dict that receive_json would build.
+                    message = BoardMessage.model_validate_json(raw)
                 except ValidationError as exc:
                     await websocket.send_json(
                         {
@@ -268,10 +316,13 @@ def create_app() -> FastAPI:
                     )
                     continue
 
-                envelope = BoardEventEnvelope.from_message(board_id, message)
+                envelope = BoardEventEnvelope.from_validated_message(board_id, message)
                 try:
-                    await pipeline.publish(envelope)
-                except Exception:  # pragma: no cover - network/transient failures
+                    # Hands the envelope to the pipeline's coalescing drain
+                    # task, so the receive loop never blocks on a broker
+                    # round-trip per message.
+                    pipeline.publish_nowait(envelope)
+                except RuntimeError:  # pragma: no cover - startup race
                     logger.exception(
                         "Failed to publish board event",
                         extra={"board_id": board_id, "action": message.action},
@@ -26,6 +26,11 @@ logger = logging.getLogger(__name__)
 
 EventHandler = Callable[[ActivityEvent], Awaitable[None]]
 
+# Coalescing parameters for the batched publish path: drain at most this
+# many envelopes per round-trip, waiting briefly for concurrent producers.
+PUBLISH_BATCH_MAX = 32
+PUBLISH_BATCH_WINDOW_SECONDS = 0.002
+
 
 class BoardEventEnvelope(BaseModel):
     """Canonical transport envelope for board events."""
@@ -48,6 +53,28 @@ class BoardEventEnvelope(BaseModel):
             idempotency_key=correlation_id,
         )
 
+    @classmethod
+    def from_validated_message(cls, board_id: str, message: BoardMessage) -> "BoardEventEnvelope":
+        """Build an envelope from a message that has already been validated.
+
+        The websocket handler validates the inbound ``BoardMessage``
+        immediately before enveloping it, so ``model_construct`` skips the
+        redundant second pass through the validator.
+        """
+
+        correlation_id = message.correlation_id
+        if correlation_id is None:
+            correlation_id = str(uuid4())
+            message = message.model_copy(update={"correlation_id": correlation_id})
+        return cls.model_construct(
+            event_id=str(uuid4()),
+            board_id=board_id,
+            message=message,
+            published_at=datetime.now(timezone.utc),
+            correlation_id=correlation_id,
+            idempotency_key=correlation_id,
+        )
+
     def json_bytes(self) -> bytes:
         """Serialise the envelope for transport."""
 
@@ -349,6 +376,8 @@ class EventPipeline:
         self._subscriber: RedisActivitySubscriber | None = None
         self._metrics = metrics
         self._ready = False
+        self._publish_queue: asyncio.Queue[BoardEventEnvelope] = asyncio.Queue()
+        self._drain_task: asyncio.Task[None] | None = None
 
     @property
     def ready(self) -> bool:
@@ -358,22 +387,29 @@ class EventPipeline:
         if self._settings.event_transport == "memory":
             self._publisher = InMemoryEventPublisher(self._handler)
             await self._publisher.start()
-            self._ready = True
-            return
-
-        self._subscriber = RedisActivitySubscriber(self._settings, self._handler)
-        await self._subscriber.start()
-        publisher = RabbitMQEventPublisher(self._settings)
-        try:
-            await publisher.start()
-        except Exception:
-            await self._subscriber.stop()
-            self._subscriber = None
-            raise
-        self._publisher = publisher
+        else:
+            self._subscriber = RedisActivitySubscriber(self._settings, self._handler)
+            await self._subscriber.start()
+            publisher = RabbitMQEventPublisher(self._settings)
+            try:
+                await publisher.start()
+            except Exception:
+                await self._subscriber.stop()
+                self._subscriber = None
+                raise
+            self._publisher = publisher
+        self._drain_task = asyncio.create_task(
+            self._drain_publish_queue(), name="advanced-publish-drain"
+        )
         self._ready = True
 
     async def stop(self) -> None:
+        if self._drain_task:
+            self._drain_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._drain_task
+            self._drain_task = None
+        await self._flush_pending()
         if self._publisher:
             await self._publisher.stop()
             self._publisher = None
@@ -382,6 +418,61 @@ class EventPipeline:
             self._subscriber = None
         self._ready = False
 
+    def publish_nowait(self, envelope: BoardEventEnvelope) -> None:
+        """Queue an envelope for the coalescing drain task and return.
+
+        The drain task batches queued envelopes, so many small client
+        messages amortise the broker round-trip instead of paying for one
+        each. A single consumer drains in FIFO order, preserving per-board
+        ordering.
+        """
+
+        if not self._publisher:
+            raise RuntimeError("Event pipeline has not been started.")
+        self._publish_queue.put_nowait(envelope)
+
+    async def _drain_publish_queue(self) -> None:
+        queue = self._publish_queue
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < PUBLISH_BATCH_MAX - 1:
+                # Brief window so concurrent producers can join the batch.
+                await asyncio.sleep(PUBLISH_BATCH_WINDOW_SECONDS)
+            while len(batch) < PUBLISH_BATCH_MAX:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            for envelope in batch:
+                try:
+                    await self.publish(envelope)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:  # pragma: no cover - network/transient failures
+                    logger.exception(
+                        "Failed to publish queued board event",
+                        extra={
+                            "event_id": envelope.event_id,
+                            "board_id": envelope.board_id,
+                        },
+                    )
+
+    async def _flush_pending(self) -> None:
+        """Publish whatever is still queued before the transport shuts down."""
+
+        while True:
+            try:
+                envelope = self._publish_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await self.publish(envelope)
+            except Exception:  # pragma: no cover - network/transient failures
+                logger.exception(
+                    "Dropped queued board event during shutdown",
+                    extra={"event_id": envelope.event_id, "board_id": envelope.board_id},
+                )
+
     async def publish(self, envelope: BoardEventEnvelope) -> None:
         if not self._publisher:
             raise RuntimeError("Event pipeline has not been started.")
@@ -84,7 +84,7 @@ class RealtimeBroker:
 
         async with self._lock:
             total_connections = sum(len(connections) for connections in self._boards.values())
-            if total_connections >= settings.websocket_max_connections:
+            if total_connections >= settings.hot.websocket_max_connections:
                 raise ConnectionLimitExceeded("Websocket connection limit reached.")
             self._boards[board_id].add(websocket)
             active = len(self._boards[board_id])
@@ -109,6 +109,9 @@ class RealtimeBroker:
             connections = list(self._boards.get(event.board, set()))
             listeners = list(self._activity_subscribers)
         enriched = event.model_copy(update={"active_connections": len(connections)})
+        # Serialise once through pydantic's Rust encoder and share the text
+        # across the fan-out, instead of one stdlib json.dumps per client.
+        payload = enriched.model_dump_json()
 
         stale: list[WebSocket] = []
         for websocket in connections:
@@ -116,7 +119,7 @@ class RealtimeBroker:
                 stale.append(websocket)
                 continue
             try:
-                await websocket.send_json(enriched.model_dump())
+                await websocket.send_text(payload)
             except WebSocketDisconnect:
                 stale.append(websocket)
             except RuntimeError:
@@ -2,39 +2,158 @@
 
 from __future__ import annotations
 
-from typing import Awaitable, Callable, Mapping
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Apply hardened security headers consistently across HTTP responses."""
-
-    def __init__(
-        self,
-        app: ASGIApp,
-        *,
-        headers: Mapping[str, str | None],
-        remove_server_header: bool = True,
-    ) -> None:
-        super().__init__(app)
-        self._headers = {key: value for key, value in headers.items() if value}
-        self._remove_server_header = remove_server_header
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        response = await call_next(request)
-        for header, value in self._headers.items():
-            if header.lower() == "content-security-policy":
-                response.headers[header] = value
-                continue
-            response.headers.setdefault(header, value)
-        if self._remove_server_header:
-            response.headers.pop("server", None)
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import Settings
+
+_VARY_ORIGIN = (b"vary", b"Origin")
+_CSP_NAME = b"content-security-policy"
+
+# Request headers the Fetch spec safelists: preflights must accept these
+# regardless of the configured allow list, as CORSMiddleware did.
+_SAFELISTED_REQUEST_HEADERS = frozenset(
+    {"accept", "accept-language", "content-language", "content-type"}
+)
+
+
+class CombinedSecurityCORSMiddleware:
+    """Single ASGI layer handling CORS and security-header injection.
+
+    Collapses what used to be two wrappers (``CORSMiddleware`` plus a
+    ``BaseHTTPMiddleware`` for security headers) into one plain ASGI
+    callable: preflight requests are answered from precomputed header
+    lists without walking the rest of the stack, and every other response
+    gets the security and CORS headers appended in a single pass over the
+    ``http.response.start`` message.
+    """
+
+    def __init__(self, app: ASGIApp, *, settings: Settings) -> None:
+        self.app = app
+        self._allowed_origins = settings.allowed_origins_frozen
+        self._allow_methods = frozenset(settings.cors_allow_methods_tuple)
+        self._allow_header_names = _SAFELISTED_REQUEST_HEADERS.union(
+            header.lower() for header in settings.cors_allow_headers_tuple
+        )
+
+        preflight: list[tuple[bytes, bytes]] = [
+            (
+                b"access-control-allow-methods",
+                ", ".join(settings.cors_allow_methods_tuple).encode("latin-1"),
+            ),
+            (b"access-control-max-age", str(settings.cors_max_age).encode("latin-1")),
+        ]
+        if settings.cors_allow_headers_tuple:
+            preflight.append(
+                (
+                    b"access-control-allow-headers",
+                    ", ".join(settings.cors_allow_headers_tuple).encode("latin-1"),
+                )
+            )
+        simple: list[tuple[bytes, bytes]] = []
+        if settings.cors_expose_headers_tuple:
+            simple.append(
+                (
+                    b"access-control-expose-headers",
+                    ", ".join(settings.cors_expose_headers_tuple).encode("latin-1"),
+                )
+            )
+        if settings.cors_allow_credentials:
+            preflight.append((b"access-control-allow-credentials", b"true"))
+            simple.append((b"access-control-allow-credentials", b"true"))
+        self._preflight_headers = tuple(preflight)
+        self._simple_headers = tuple(simple)
+
+        security = settings.security_headers if settings.security_headers_enabled else {}
+        self._security_headers: tuple[tuple[bytes, bytes], ...] = tuple(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in security.items()
+        )
+        self._remove_server_header = bool(security) and settings.remove_server_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        origin = headers.get("origin")
+        if (
+            scope["method"] == "OPTIONS"
+            and origin is not None
+            and "access-control-request-method" in headers
+        ):
+            response = self._preflight_response(origin, headers)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, self._wrap_send(send, origin))
+
+    def _preflight_response(self, origin: str, request_headers: Headers) -> PlainTextResponse:
+        failures: list[str] = []
+        if origin not in self._allowed_origins:
+            failures.append("origin")
+        if request_headers["access-control-request-method"] not in self._allow_methods:
+            failures.append("method")
+        requested_headers = request_headers.get("access-control-request-headers")
+        if requested_headers:
+            for header in requested_headers.split(","):
+                if header.strip().lower() not in self._allow_header_names:
+                    failures.append("headers")
+                    break
+
+        if failures:
+            response = PlainTextResponse(
+                f"Disallowed CORS {', '.join(failures)}", status_code=400
+            )
+        else:
+            response = PlainTextResponse("OK", status_code=200)
+            response.raw_headers.append(
+                (b"access-control-allow-origin", origin.encode("latin-1"))
+            )
+            response.raw_headers.extend(self._preflight_headers)
+            response.raw_headers.append(_VARY_ORIGIN)
+        self._apply_security_headers(response.raw_headers)
         return response
+
+    def _apply_security_headers(self, raw_headers: list[tuple[bytes, bytes]]) -> None:
+        existing = {name.lower() for name, _ in raw_headers}
+        for name, value in self._security_headers:
+            if name == _CSP_NAME and name in existing:
+                # The CSP must win over anything a handler set, matching
+                # the override semantics of the previous middleware.
+                raw_headers[:] = [
+                    (header, header_value)
+                    for header, header_value in raw_headers
+                    if header.lower() != _CSP_NAME
+                ]
+                raw_headers.append((name, value))
+            elif name not in existing:
+                raw_headers.append((name, value))
+        if self._remove_server_header:
+            raw_headers[:] = [
+                (name, value) for name, value in raw_headers if name.lower() != b"server"
+            ]
+
+    def _wrap_send(self, send: Send, origin: str | None) -> Send:
+        simple_cors: tuple[tuple[bytes, bytes], ...] | None = None
+        if origin is not None and origin in self._allowed_origins:
+            simple_cors = (
+                (b"access-control-allow-origin", origin.encode("latin-1")),
+                _VARY_ORIGIN,
+                *self._simple_headers,
+            )
+
+        async def sender(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                raw_headers = message["headers"] = list(message.get("headers") or [])
+                self._apply_security_headers(raw_headers)
+                if simple_cors:
+                    raw_headers.extend(simple_cors)
+            await send(message)
+
+        return sender
+
+
+__all__ = ["CombinedSecurityCORSMiddleware"]
@@ -22,7 +22,7 @@ from projects.02-intermediate.app.core.config import get_settings
 from projects.02-intermediate.app.db.base import SQLModel
 from projects.02-intermediate.app.models import TaskStatus, User
 from projects.02-intermediate.app.schemas import TaskCreate, TaskUpdate
-from projects.02-intermediate.app.services import UserService
+from projects.02-intermediate.app.services import TaskService, UserService
 
 pytestmark = pytest.mark.asyncio
 
@@ -105,10 +105,11 @@ async def test_activity_events_for_login_and_task_changes(
     assert events_after_login[0].action is ActivityAction.LOGIN
     assert events_after_login[0].metadata.get("source") == "api"
 
+    task_service = TaskService(session)
     task_payload = TaskCreate(title="Write tests", description="Ensure activity log works.")
     task_read = await create_task(
         payload=task_payload,
-        session=session,
+        service=task_service,
         current_user=user,
         activity_service=service,
     )
@@ -120,12 +121,13 @@ async def test_activity_events_for_login_and_task_changes(
     updated = await update_task(
         task_id=task_read.id,
         payload=update_payload,
-        session=session,
+        service=task_service,
         current_user=user,
         activity_service=service,
     )
     assert updated.status == TaskStatus.COMPLETED
 
+    await asyncio.sleep(0.01)
     feed = await service.list_recent(limit=5)
     assert len(feed) == 3
     assert feed[0].action is ActivityAction.TASK_UPDATED
@@ -70,14 +70,14 @@ async def test_task_list_cache_hit_miss_and_invalidation(session: AsyncSession,
 
     cache_metrics.reset()
 
-    first = await list_tasks(session=session, current_user=user)
+    first = await list_tasks(service=service, current_user=user, include_total=True)
     assert first.total == 2
     metrics = cache_metrics.snapshot()
     assert metrics["misses"] == 1
     assert metrics["hits"] == 0
     assert metrics["skipped"] == 0
 
-    second = await list_tasks(session=session, current_user=user)
+    second = await list_tasks(service=service, current_user=user, include_total=True)
     metrics = cache_metrics.snapshot()
     assert metrics["hits"] == 1
     assert metrics["misses"] == 1
@@ -85,7 +85,7 @@ async def test_task_list_cache_hit_miss_and_invalidation(session: AsyncSession,
 
     await service.create_task(owner_id=owner_id, title="Task 3")
 
-    third = await list_tasks(session=session, current_user=user)
+    third = await list_tasks(service=service, current_user=user, include_total=True)
     metrics = cache_metrics.snapshot()
     assert metrics["misses"] == 2
     assert metrics["hits"] == 1
@@ -106,7 +106,7 @@ async def test_task_statistics_cache_refreshes_after_update(session: AsyncSessio
 
     cache_metrics.reset()
 
-    initial = await get_task_statistics(session=session, current_user=user)
+    initial = await get_task_statistics(service=service, current_user=user)
     assert initial.owner_id == owner_id
     assert initial.total == 2
     assert initial.by_status[TaskStatus.COMPLETED.value] == 1
@@ -115,7 +115,7 @@ async def test_task_statistics_cache_refreshes_after_update(session: AsyncSessio
     assert metrics["misses"] == 1
     assert metrics["hits"] == 0
 
-    cached = await get_task_statistics(session=session, current_user=user)
+    cached = await get_task_statistics(service=service, current_user=user)
     metrics = cache_metrics.snapshot()
     assert metrics["hits"] == 1
     assert metrics["misses"] == 1
@@ -124,7 +124,7 @@ async def test_task_statistics_cache_refreshes_after_update(session: AsyncSessio
     assert completed.id is not None
     await service.update_task(completed.id, status=TaskStatus.IN_PROGRESS)
 
-    refreshed = await get_task_statistics(session=session, current_user=user)
+    refreshed = await get_task_statistics(service=service, current_user=user)
     metrics = cache_metrics.snapshot()
     assert metrics["misses"] == 2
     assert metrics["hits"] == 1
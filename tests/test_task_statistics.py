@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from projects.01-beginner.app.api.routers.tasks import get_task_statistics
+from projects.01-beginner.app.db.base import SQLModel
+from projects.01-beginner.app.models import TaskStatus, User
+from projects.01-beginner.app.services import TaskService, UserService
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture()
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture()
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as db_session:
+        yield db_session
+
+
+@pytest.fixture()
+async def user(session: AsyncSession) -> User:
+    service = UserService(session)
+    account = await service.create_user(email="stats@example.com", password="secret", full_name="Stats User")
+    assert account.id is not None
+    return account
+
+
+async def test_statistics_aggregate_counts_by_status(session: AsyncSession, user: User) -> None:
+    service = TaskService(session)
+    assert user.id is not None
+    await service.create_task(owner_id=user.id, title="Pending work")
+    await service.create_task(owner_id=user.id, title="Shipped work", status=TaskStatus.COMPLETED)
+
+    stats = await get_task_statistics(session=session, current_user=user)
+
+    assert stats.owner_id == user.id
+    assert stats.total == 2
+    assert stats.by_status[TaskStatus.PENDING.value] == 1
+    assert stats.by_status[TaskStatus.COMPLETED.value] == 1
+    assert stats.by_status[TaskStatus.CANCELLED.value] == 0
+
+
+async def test_statistics_forbidden_for_other_owners(session: AsyncSession, user: User) -> None:
+    assert user.id is not None
+    with pytest.raises(HTTPException) as exc:
+        await get_task_statistics(session=session, current_user=user, owner_id=user.id + 1)
+    assert exc.value.status_code == 403